@@ -3,48 +3,37 @@
 Remove duplicates and drop vendor specific mappings.
 """
 
+import importlib.util
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-import black
 import pendulum
 
+from mri_acronyms.models.catalog_loader import CATALOG_ENV, catalog_path
+from mri_acronyms.models.catalog_snapshot import is_current, save_snapshot
 from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory
-from mri_acronyms.models.validate_models import check_for_duplicates, dedup_acronyms
+from mri_acronyms.models.validate_models import (
+    check_for_duplicates,
+    get_catalog_index,
+    get_unique_word_map,
+    get_vendor_acronym_map,
+)
+from mri_acronyms.util.file_utils import atomic_path, content_hash
 from mri_acronyms.util.logger import init_logger, relative_size
 
 log = init_logger(caller=__file__)
 MODULE = Path(__file__).resolve().name
 CWD_PATH = Path(__file__).resolve().parent
-
-
-def save_txt(
-    path: Path,
-    data: str,
-) -> bool:
-    """Save string data to disk.
-
-    Args:
-        path (Path): destination file path (with extension)
-        data (str): payload to save
-
-    Returns:
-        True if file was written successfully
-    """
-    if path.is_file():
-        path.unlink(missing_ok=True)
-    if isinstance(data, str) and len(data) > 1:
-        path.write_text(data=data, encoding="utf-8")
-        if path.is_file() and path.stat().st_size > 1:
-            log.info(f"saved: {relative_size(path)}")
-            return True
-    return False
+INDENT = " " * 4
+LUT_NAME = "CATEGORY_TO_ACRONYM_LUT"
+VENDOR_LUT_NAME = "VENDOR_ACRONYM_LUT"
+CONTENT_HASH_PREFIX = "content-hash: "
 
 
 def blacken_code_block(
     src_contents: str,
 ) -> str:
-    """Reformat code block contents to with black auto-formatter.
+    """Reformat code block contents to with black auto-formatter (optional dependency, verification only).
 
     https://github.com/psf/black/blob/main/src/black/mode.py
     https://black.readthedocs.io/en/stable/contributing/reference/reference_classes.html#black.Mode
@@ -56,6 +45,9 @@ def blacken_code_block(
     Returns:
         str: formatted code block validated by black
     """
+    # optional dependency, only imported if verification is requested
+    import black  # noqa: PLC0415
+
     mode = black.Mode(
         target_versions={black.TargetVersion.PY311},
         line_length=120,
@@ -70,78 +62,139 @@ def blacken_code_block(
     return result
 
 
+def quote(text: str) -> str:
+    """String literal with black string normalization (prefer double quotes, unless it adds escapes)."""
+    text = text.replace("\\", "\\\\")
+    if '"' in text and "'" not in text:
+        return f"'{text}'"
+    return '"' + text.replace('"', '\\"') + '"'
+
+
 def format_entry_row(
     key: str,
-    data_row: Union[List[str], Tuple[str]],
-) -> List[str]:
+    data_row: Union[List[str], Tuple[str, ...]],
+    depth: int = 2,
+) -> Iterator[str]:
     """Helper method for data formatting with applicable delimiters (square brackets/parentheses).
 
     Args:
         key (str): from dict
-        data_row (List, Tuple):
+        data_row (List, Tuple): elements, one per line (magic trailing comma)
+        depth (int): indentation level of key
 
     Returns:
         newline and indented formatted of tuple/list elements
     """
-    indent = " " * 2
-    lines = []
-    if isinstance(data_row, tuple):
-        delimiters = ("(", ")")
-    elif isinstance(data_row, list):
-        delimiters = ("[", "]")
-    if isinstance(data_row, (List, Tuple)):
-        formatted_line = f'{indent}"{key}": {delimiters[0]}\n'
-        for element in data_row:
-            formatted_line += f'{indent}{indent}"{element}",\n'
-        formatted_line += f"{indent}{delimiters[1]},\n"
-        lines.append(formatted_line)
-    return lines
+    indent = INDENT * depth
+    delimiters = ("(", ")") if isinstance(data_row, tuple) else ("[", "]")
+    if not data_row:
+        yield f"{indent}{quote(key)}: {delimiters[0]}{delimiters[1]},\n"
+        return
+    yield f"{indent}{quote(key)}: {delimiters[0]}\n"
+    for element in data_row:
+        yield f"{indent}{INDENT}{quote(element)},\n"
+    yield f"{indent}{delimiters[1]},\n"
+
+
+def iter_py_lines(
+    name: str,
+    docstring: str,
+    code_block: Dict[str, Dict[str, Union[List[str], Tuple[str, ...]]]],
+) -> Iterator[str]:
+    """Emit canonical (black formatted) source of nested dictionary, one line at a time.
+
+    Args:
+        name (str): variable declaration
+        docstring (str): module docstring text (without quotes)
+        code_block (Dict): key: category, value: {key: name, value: list/tuple of strings}
+
+    Returns:
+        lines of python module (deterministic: identical input produces identical output)
+    """
+    yield f'"""{docstring}"""\n'
+    yield "\n"
+    yield f"{name} = {{\n"
+    for category, entries in code_block.items():
+        yield f"{INDENT}{quote(category)}: {{\n"
+        for key, val in entries.items():
+            yield from format_entry_row(key, val, depth=2)
+        yield f"{INDENT}}},\n"
+    yield "}\n"
 
 
 def save_to_py_file(
     name: str,
     docstring: str,
     code_block: Union[Dict, List, None],
+    verify: bool = False,
 ) -> bool:
-    """Save python data structure to '.py' file.
-
-    allow flexibility for data input: Dict vs. List
+    """Save python data structure to '.py' file (streamed to disk in single pass).
 
     Args:
         name (str): variable declaration
         docstring (str): docstring for top of '.py' file
-        code_block (Dict, List): payload of source code
+        code_block (Dict): payload of source code
+        verify (bool): confirm output is unchanged by black auto-formatter (requires black)
 
     output:
              name --> CATEGORY_TO_ACRONYM_LUT = {
-        code_block -> "apparent_diffusion_coefficient_map": ("adc",),
+        code_block -> "apparent_diffusion_coefficient_map": ["adc"],
                  ...
         }
 
     Returns:
         True if file was saved successfully.
     """
-    lines = []
-    path = Path(CWD_PATH, "lut", f"{name.lower()}.py")
-    if isinstance(code_block, Dict):
-        lines.append(f"{docstring}\n{name}" + " = {\n")
-        for category in code_block.keys():
-            lines.append(f"'{category}'" + ": {\n")
-            for key, val in code_block[category].items():
-                lines.extend(format_entry_row(key, val))
-            lines.append("},\n")
-        lines.append("}\n")
+    if not isinstance(code_block, Dict):
+        return False
+    if verify and importlib.util.find_spec("black") is None:
+        log.warning("black is not installed: skipped formatting verification")
+        verify = False
+    path = lut_path(name)
+    preview = ""
+    try:
+        with atomic_path(path) as tmp_path:
+            with tmp_path.open(mode="w", encoding="utf-8", newline="\n") as file:
+                for line in iter_py_lines(name=name, docstring=docstring, code_block=code_block):
+                    file.write(line)
+                    if len(preview) < 1000:
+                        preview += line
+            # verify before rename, previous lookup table is kept on mismatch
+            if verify and blacken_code_block(contents := tmp_path.read_text(encoding="utf-8")) != contents:
+                raise ValueError("black formatting mismatch")
+    except (OSError, ValueError):
+        log.exception(f"{relative_size(path)}")
+        return False
+    print(f"\npreview: {path.name}\n{preview[:1000]}\n...")
+    if path.is_file() and path.stat().st_size > 1:
+        log.info(f"saved: {relative_size(path)}")
+        return True
+    return False
 
-    # convert single quotes to double, validate formatting
-    formatted_str = blacken_code_block("".join(lines))
-    print(f"\npreview: {path.name}\n{formatted_str[:1000]}\n...")
-    return save_txt(path=path, data=formatted_str)
 
+def lut_path(name: str) -> Path:
+    """Location of generated lookup table module."""
+    return Path(CWD_PATH, "lut", f"{name.lower()}.py")
 
-MRI_DOCSTRING = f"""
-'''Grouped MR vendor acronyms by pulse sequence or scanning parameter.
 
-auto-generated by '{MODULE}' on {pendulum.now().to_date_string()}
+def read_content_hash(path: Path) -> Optional[str]:
+    """Content hash recorded in docstring of generated module, None if file or hash is missing."""
+    if not path.is_file():
+        return None
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if line.startswith(CONTENT_HASH_PREFIX):
+                return line.removeprefix(CONTENT_HASH_PREFIX).strip()
+            if line.startswith(tuple(LUT_DOCSTRINGS)):
+                break
+    return None
+
+
+# placeholders: module, date, digest (content hash of lookup table, date only changes with content)
+MRI_DOCSTRING = """Grouped MR vendor acronyms by pulse sequence or scanning parameter.
+
+auto-generated by '{module}' on {date}
+content-hash: {digest}
 
 vendors: "Siemens", "GE", "Philips", "Canon", "Hitachi"
 mri-category:
@@ -152,58 +205,72 @@ https://pubs.rsna.org/doi/10.1148/rg.262055063
 https://www.imaios.com/en/e-Courses/e-MRI/MRI-Sequences/Sequence-classification
 https://www.imaios.com/en/e-Courses/e-MRI/MRI-Sequences/Sequences-acronyms
 https://www.siemens-healthineers.com/en-us/magnetic-resonance-imaging/magnetom-world/publications/mr-basics
-'''
 """
 
 
-def get_unique_word_map(
-    sort_values: bool,
-) -> Dict[str, Dict[str, List[str]]]:
-    """Create unique word list for given dictionary key in sorted order.
+# placeholders: module, date, digest
+VENDOR_DOCSTRING = """Reverse index of vendor acronyms to pulse sequence/parameter (cross-vendor translation).
 
-    Note: this breaks vendor-specific terminology mapping
+auto-generated by '{module}' on {date}
+content-hash: {digest}
+
+vendors: "siemens", "ge", "philips", "canon", "hitachi"
+vendor:
+    key: casefolded, sanitized vendor acronym
+    value: (category, pulse-sequence/parameter) of first occurrence in catalog
+"""
+
+# generated lookup table module name to docstring template
+LUT_DOCSTRINGS = {
+    LUT_NAME: MRI_DOCSTRING,
+    VENDOR_LUT_NAME: VENDOR_DOCSTRING,
+}
+
+
+def save_lut(
+    name: str,
+    code_block: Dict,
+    verify: bool = False,
+    force: bool = False,
+) -> bool:
+    """Save generated lookup table module unless content hash recorded in existing module matches.
 
     Args:
-        sort_values (bool): reorder values in alphabetical order
+        name (str): variable declaration (key of LUT_DOCSTRINGS)
+        code_block (Dict): payload of source code
+        verify (bool): confirm lookup table is unchanged by black auto-formatter (requires black)
+        force (bool): rewrite module even if content is unchanged
 
     Returns:
-        key: mri-category: {
-                key: pulse-sequence/parameters {
-                    values: list(vendor acronyms) sorted, unique
-                        exclude duplicates
-                        exclude NULLs
-                }
-            }
+        True if file was written successfully (or is up to date)
     """
-    word_map: Dict[str, Dict[str, List[str]]] = {}
-    for category in PulseSequenceCategory:
-        word_map[category.name] = {}
-        for model in category.acronyms:
-            # initialize empty list for key
-            word_map[category.name][model.name] = []
-            # remove duplicates/nulls from tuple entry
-            for word in dedup_acronyms(model=model):
-                # avoid duplicates in mapping
-                if word not in word_map[category.name][model.name]:
-                    word_map[category.name][model.name].append(word)
-            # for each key, sort values alphabetically
-            if sort_values:
-                word_map[category.name][model.name].sort()
-    return word_map
-
-
-def generate(sort_keys: bool) -> bool:
-    """Creates lookup table mapping.
+    digest = content_hash(name, LUT_DOCSTRINGS[name], code_block)
+    if not force and read_content_hash(lut_path(name)) == digest:
+        log.info(f"unchanged: {relative_size(lut_path(name))} {digest[:12]}")
+        return True
+    docstring = LUT_DOCSTRINGS[name].format(module=MODULE, date=pendulum.now().to_date_string(), digest=digest)
+    return save_to_py_file(name=name, docstring=docstring, code_block=code_block, verify=verify)
+
+
+def generate(sort_keys: bool, verify: bool = False, force: bool = False) -> bool:
+    """Creates lookup table mappings and binary snapshot of validated catalog (skipped if content is unchanged).
 
         key: MRI parameter/ pulse sequence type
         value: unique list of possible word matches (no duplicates) optional: lowercase
+        reverse index: vendor acronym to MRI parameter/ pulse sequence (cross-vendor translation)
 
     Args:
         sort_keys (bool): sort nested dictionary by keys in alphabetical order
+        verify (bool): confirm lookup table is unchanged by black auto-formatter (requires black)
+        force (bool): rebuild outputs even if content hash/snapshot digest match
 
     Returns:
-        True if file was written successfully
+        True if files were written successfully (or are up to date)
     """
+    if catalog_path() is not None:
+        # packaged lookup tables describe default catalog, site catalogs are indexed at runtime
+        log.error(f"not generated: {CATALOG_ENV} is set, external catalog is indexed at runtime")
+        return False
     check_for_duplicates()
     word_map = get_unique_word_map(sort_values=True)
     if sort_keys:
@@ -215,8 +282,16 @@ def generate(sort_keys: bool) -> bool:
         code_block = sorted_by_keys
     else:
         code_block = word_map
-    return save_to_py_file(name="CATEGORY_TO_ACRONYM_LUT", docstring=MRI_DOCSTRING, code_block=code_block)
+    saved_lut = save_lut(name=LUT_NAME, code_block=code_block, verify=verify, force=force)
+    saved_lut &= save_lut(name=VENDOR_LUT_NAME, code_block=get_vendor_acronym_map(), verify=verify, force=force)
+    if not force and is_current():
+        return saved_lut
+    catalog: Dict[str, List] = {category.name: [] for category in PulseSequenceCategory}
+    for entry in get_catalog_index().entries:
+        catalog[entry.category.name].append(entry.model)
+    saved_snapshot = save_snapshot(catalog=catalog)
+    return saved_lut and saved_snapshot
 
 
 if __name__ == "__main__":
-    generate(sort_keys=False)
+    generate(sort_keys=False, verify=True)
@@ -0,0 +1,126 @@
+"""Classify large keyword files in parallel (shards matched across process pool).
+
+each worker process builds the acronym index once at startup, shards are written back in input order
+    python classify_batch.py keywords.txt --output matches.jsonl --max-workers 32
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterable, List, Optional, Sequence, TextIO
+
+from mri_acronyms.index.acronym_index import get_acronym_index
+from mri_acronyms.search_by_keyword import chunked, match_acronyms, read_keywords, to_record
+from mri_acronyms.util.constants import STREAM_CHUNK_SIZE
+from mri_acronyms.util.logger import init_logger, relative_size
+
+log = init_logger(caller=__file__)
+
+
+def init_worker() -> None:
+    """Build acronym index once per worker process (reused by every shard)."""
+    get_acronym_index()
+
+
+def classify_shard(
+    keywords: List[str],
+    cutoff: float,
+) -> str:
+    """Match shard of keywords (single threaded, parallelism is provided by process pool).
+
+    Args:
+        keywords (List): one shard of input keywords
+        cutoff (float): threshold for matching percentage (if < #.##%, no match is found)
+
+    Returns:
+        str: JSON lines (one per keyword) serialized within worker
+    """
+    matches = match_acronyms(keywords=keywords, cutoff=cutoff, workers=1)
+    return "".join(json.dumps(to_record(keyword, match)) + "\n" for keyword, match in zip(keywords, matches))
+
+
+def classify_lines(
+    lines: Iterable[str],
+    output: TextIO,
+    cutoff: float = 70.0,
+    shard_size: int = STREAM_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+) -> int:
+    """Split keywords into shards, match in process pool, merge results in input order.
+
+    number of shards in flight is bounded (2 per worker) to keep memory constant for large inputs
+
+    Args:
+        lines (Iterable): one keyword per line (e.g. open file)
+        output (TextIO): destination of JSON lines
+        cutoff (float): threshold for matching percentage (if < #.##%, no match is found)
+        shard_size (int): number of keywords per shard
+        max_workers (int): number of worker processes (default: all cores)
+
+    Returns:
+        int: number of keywords processed
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    count = 0
+    pending: Deque[Future] = deque()
+    # spawn: fork() is unsafe once background threads (log listener) are running
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=init_worker) as executor:
+        for shard in chunked(read_keywords(lines), size=shard_size):
+            pending.append(executor.submit(classify_shard, shard, cutoff))
+            count += len(shard)
+            if len(pending) >= 2 * max_workers:
+                output.write(pending.popleft().result())
+        while pending:
+            output.write(pending.popleft().result())
+    return count
+
+
+def classify_file(
+    path: Path,
+    output: TextIO,
+    cutoff: float = 70.0,
+    shard_size: int = STREAM_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+) -> int:
+    """Classify keyword file (one keyword per line) in parallel.
+
+    Args:
+        path (Path): input file
+        output (TextIO): destination of JSON lines
+        cutoff (float): threshold for matching percentage (if < #.##%, no match is found)
+        shard_size (int): number of keywords per shard
+        max_workers (int): number of worker processes (default: all cores)
+
+    Returns:
+        int: number of keywords processed
+    """
+    with open(path, encoding="utf-8", errors="replace") as lines:
+        return classify_lines(lines, output, cutoff=cutoff, shard_size=shard_size, max_workers=max_workers)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", type=Path, help="file with one keyword per line")
+    parser.add_argument("--output", type=Path, help="destination '.jsonl' file (default: stdout)")
+    parser.add_argument("--cutoff", type=float, default=70.0, help="threshold for matching percentage")
+    parser.add_argument("--shard-size", type=int, default=STREAM_CHUNK_SIZE, help="keywords per shard")
+    parser.add_argument("--max-workers", type=int, help="number of worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+    options = {"cutoff": args.cutoff, "shard_size": args.shard_size, "max_workers": args.max_workers}
+    if args.output is None:
+        classify_file(args.input, sys.stdout, **options)
+    else:
+        with open(args.output, mode="w", encoding="utf-8") as output:
+            count = classify_file(args.input, output, **options)
+        log.info(f"saved: {relative_size(args.output)} {count} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,108 +1,165 @@
-"""Convert lookup tables to '.csv' report."""
+"""Convert lookup tables to '.csv' report (optional: '.parquet', Arrow IPC '.arrow').
+
+csv: vendor acronyms joined by SEP ("; "), every field quoted (github prettifier support)
+parquet/arrow: typed columns for analytics without parsing/splitting (e.g. memory-mapped 'pl.scan_ipc')
+    Group: uint8, Category: enum (dictionary-encoded), vendor columns: list<string>
+"""
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
-import pandas as pd
+import polars as pl
 
 from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory
-from mri_acronyms.models.validate_models import check_for_duplicates
+from mri_acronyms.models.validate_models import check_for_duplicates, get_catalog_index
 from mri_acronyms.util.constants import HEADERS, SEP
+from mri_acronyms.util.file_utils import atomic_path, content_hash, read_sidecar_hash, sidecar_path, write_atomic
 from mri_acronyms.util.logger import PROJECT_ROOT, init_logger, relative_size
 
 log = init_logger(caller=__file__)
 
-pd.set_option("display.max_rows", 128)
-pd.set_option("expand_frame_repr", False)
-pd.set_option("display.max_columns", 16)
-pd.set_option("display.max_colwidth", 36)
-
-
-def check_and_purge(path: Path) -> None:
-    """Create parent output folder (if not exists).
-
-    Args:
-        path (Path): destination file path (with extension)
-
-    Returns:
-        bool: true if file was purged successfully
-    """
-    try:
-        if not path.parent.is_dir():
-            path.parent.mkdir(parents=True, exist_ok=True)
-        if path.is_file():
-            print(f" purged: '{path.name}'\t ({path.stat().st_size} bytes)")
-            path.unlink(missing_ok=False)
-    except (OSError, PermissionError):
-        log.exception(f"{relative_size(path)}")
+# report format to file extension
+REPORT_FORMATS = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "ipc": ".arrow",
+}
+VENDOR_COLUMNS = HEADERS[3:]
+# typed report columns (csv joins vendor lists to strings)
+REPORT_SCHEMA: Dict[str, pl.DataType] = {
+    HEADERS[0]: pl.UInt8(),
+    HEADERS[1]: pl.Enum([str(category) for category in PulseSequenceCategory]),
+    HEADERS[2]: pl.String(),
+    **{column: pl.List(pl.String) for column in VENDOR_COLUMNS},
+}
 
 
 def build_data_records() -> List[List[Any]]:
-    """Convert key/value dictionary to list of lists for pandas.
+    """Convert key/value dictionary to list of lists (one row per pulse sequence/parameter).
 
        [Order, Category, Sequence/Parameter", "Siemens", "GE", "Philips", "Canon", "Hitachi"]
 
     Returns list:
         [ balanced_steady_state_gradient_echo,
-            TrueFISP,   FIESTA; COSMIC,    Balanced FFE,  True SSFP,  Balanced SARGE; BASG ]
-        | <-Siemens-> | <-----GE------> | <--Philips--> | <-Canon-> | <-----Hitachi------> |
+            [TrueFISP], [FIESTA, COSMIC], [Balanced FFE], [True SSFP], [Balanced SARGE, BASG] ]
+        | <-Siemens-> | <-----GE------> | <--Philips--> | <-Canon-> | <-------Hitachi------> |
     """
     data_rows = []
     check_for_duplicates()
-    for category in PulseSequenceCategory:
-        for acronym in category.acronyms:
-            # init per-row list, with key as first element (1st column in pandas)
-            row = [
-                category.order,
-                category.name.lower(),
-                acronym.name,
-                SEP.join(acronym.siemens),
-                SEP.join(acronym.ge),
-                SEP.join(acronym.philips),
-                SEP.join(acronym.canon),
-                SEP.join(acronym.hitachi),
-            ]
-            data_rows.append(row)
+    for category, acronym, _ in get_catalog_index().entries:
+        # init per-row list, with key as first element (1st column in report)
+        row = [
+            category.order,
+            category.name.lower(),
+            acronym.name,
+            list(acronym.siemens),
+            list(acronym.ge),
+            list(acronym.philips),
+            list(acronym.canon),
+            list(acronym.hitachi),
+        ]
+        data_rows.append(row)
     return data_rows
 
 
+def build_report_frame(records: Optional[List[List[Any]]] = None) -> pl.LazyFrame:
+    """Lazy report table sorted by 'Group' then 'Category' (stable, keeps catalog order within category)."""
+    data = build_data_records() if records is None else records
+    return pl.LazyFrame(data=data, schema=REPORT_SCHEMA, orient="row").sort(
+        by=[HEADERS[0], HEADERS[1]],
+        maintain_order=True,
+    )
+
+
+def write_report(
+    df: pl.DataFrame,
+    path: Path,
+    report_format: str,
+) -> None:
+    """Write report table in given format (atomic replace, previous report stays readable until rename).
+
+    Args:
+        df (pl.DataFrame): report table
+        path (Path): destination file path (with extension)
+        report_format (str): 'csv' (comma delimited, fully quoted, joined vendor lists), 'parquet' or 'ipc' (typed)
+    """
+    if report_format not in REPORT_FORMATS:
+        raise ValueError(f"invalid {report_format=} not in {list(REPORT_FORMATS)}")
+    with atomic_path(path) as tmp_path:
+        match report_format:
+            case "csv":
+                df.with_columns(pl.col(VENDOR_COLUMNS).list.join(SEP)).write_csv(
+                    file=tmp_path, separator=",", quote_char='"', quote_style="always", include_header=True
+                )
+            case "parquet":
+                df.write_parquet(file=tmp_path)
+            case "ipc":
+                df.write_ipc(file=tmp_path)
+
+
+def scan_report(path: Path) -> pl.LazyFrame:
+    """Lazily read typed report ('.arrow' is memory-mapped, uncompressed Arrow IPC, '.parquet' is scanned).
+
+    Args:
+        path (Path): report file path ('.arrow' or '.parquet')
+
+    Returns:
+        pl.LazyFrame: report table with list<string> vendor columns
+    """
+    if path.suffix == REPORT_FORMATS["ipc"]:
+        return pl.scan_ipc(path)
+    return pl.scan_parquet(path)
+
+
 def save_report(
     path=Path(PROJECT_ROOT, "data", "mri_vendor_acronyms.csv"),
+    formats: Sequence[str] = ("csv",),
+    preview: bool = False,
+    force: bool = False,
 ) -> bool:
     """Save results to '.csv' file extension with comma ',' field delimiter (github prettifier support).
 
+    reports are skipped if content hash of catalog rows matches hash saved next to report ('<name>.sha256')
+
     Args:
         path (Path): destination file path (with extension)
             creates parent directory if destination folder does not exist
+            additional formats are saved next to it with matching extension ('.parquet', '.arrow')
+        formats (Sequence): report formats to save: 'csv', 'parquet', 'ipc'
+        preview (bool): print full report table to console
+        force (bool): rewrite reports even if content is unchanged
 
     Returns:
-        bool: true, if report was created successfully
+        bool: true, if report was created successfully (or is up to date)
     """
     try:
-        check_and_purge(path)
         records = build_data_records()
-        if isinstance(records, (List, Dict)):
-            df = pd.DataFrame.from_records(data=records, columns=HEADERS)
-            # sort by 'Group' then 'Category'
-            df.sort_values(by=[HEADERS[0], HEADERS[1]], ascending=[True, True], inplace=True)
-            df.to_csv(
-                path_or_buf=path,
-                sep=",",  # comma for field delimiter
-                encoding="utf-8",
-                quoting=1,  # fully quoted
-                quotechar='"',
-                index=False,
-                header=True,
-            )
-            if path.is_file():
-                print(f"preview: '{path.name}'")
-                print(df.to_string(index=False))
-                log.info(f"saved: {relative_size(path)} {df.shape[0]} rows")
-                return True
-    except (pd.errors.ParserError, pd.errors.DtypeWarning):
+        df = None
+        for report_format in formats:
+            report_path = path.with_suffix(REPORT_FORMATS[report_format])
+            digest = content_hash(report_format, HEADERS, records)
+            if not force and read_sidecar_hash(report_path) == digest:
+                log.info(f"unchanged: {relative_size(report_path)} {digest[:12]}")
+                continue
+            if df is None:
+                df = build_report_frame(records).collect()
+            write_report(df=df, path=report_path, report_format=report_format)
+            if not report_path.is_file():
+                return False
+            write_atomic(path=sidecar_path(report_path), data=f"{digest}\n")
+            log.info(f"saved: {relative_size(report_path)} {df.height} rows")
+        if preview:
+            df = build_report_frame(records).collect() if df is None else df
+            print(f"preview: '{path.name}'")
+            with pl.Config(
+                tbl_rows=-1, tbl_cols=-1, fmt_str_lengths=36, tbl_width_chars=512, tbl_hide_dataframe_shape=True
+            ):
+                print(df)
+        return True
+    except (KeyError, ValueError, OSError, pl.exceptions.PolarsError):
         log.exception(f"{relative_size(path)}")
     return False
 
 
 if __name__ == "__main__":
-    save_report()
+    save_report(formats=("csv", "parquet", "ipc"), preview=True)
@@ -0,0 +1,287 @@
+"""Flat index of MRI acronyms for single pass fuzzy keyword matching.
+
+https://rapidfuzz.github.io/RapidFuzz/Usage/process.html
+"""
+
+from dataclasses import dataclass
+from enum import Enum, auto, unique
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from mri_acronyms.index.ngram_index import NGRAM_MIN_CUTOFF, NGRAM_MIN_KEYS, NgramIndex
+from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory
+from mri_acronyms.models.runtime_catalog import CompactModel
+from mri_acronyms.models.validate_models import exact_key, get_acronym_lut
+from mri_acronyms.util.string_table import ACRONYM_TABLE
+
+
+@unique
+class MatchPath(Enum):
+    """Search path which answered keyword lookup."""
+
+    EXACT = auto()
+    FUZZY = auto()
+
+    def __str__(self) -> str:
+        """String representation of class."""
+        return self.name.lower()
+
+
+class SearchResult:
+    """Ranked search candidate (closest acronym of given pulse sequence/parameter)."""
+
+    __slots__ = ("category", "name", "acronym", "confidence")
+
+    def __init__(self, category: str, name: str, acronym: str, confidence: float) -> None:
+        """Create search result."""
+        self.category = category
+        self.name = name
+        self.acronym = acronym
+        self.confidence = confidence
+
+    def __repr__(self) -> str:
+        """String representation of class."""
+        return (
+            f"{self.__class__.__name__}(category={self.category!r}, name={self.name!r}, "
+            f"acronym={self.acronym!r}, confidence={self.confidence})"
+        )
+
+
+class MatchResult(SearchResult):
+    """Keyword lookup result (matched acronym, confidence and search path which answered)."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, category: str, name: str, acronym: str, confidence: float, path: MatchPath) -> None:
+        """Create match result."""
+        super().__init__(category, name, acronym, confidence)
+        self.path = path
+
+    def __repr__(self) -> str:
+        """String representation of class."""
+        return f"{super().__repr__()[:-1]}, path={self.path!s})"
+
+    @property
+    def model(self) -> Optional[CompactModel]:
+        """Relevant MRI pulse sequence/parameter model (compact view resolved on access, see 'to_model')."""
+        return PulseSequenceCategory.get_model(category=self.category, name=self.name)
+
+
+@dataclass(frozen=True)
+class AcronymIndex:
+    """Immutable flattened view of lookup table (parallel arrays share position).
+
+    keys: pre-normalized (lowercase) acronyms used for scoring
+    acronym_ids: original vendor acronyms (ids of shared string table 'ACRONYM_TABLE')
+    categories: pulse sequence/parameter category of each acronym
+    names: pulse sequence/parameter name of each acronym
+    exact: casefolded acronym to position of first occurrence (read-only)
+    use_ngrams: prefilter fuzzy candidates with n-gram inverted index (large vocabularies),
+        index is built on first query with cutoff >= NGRAM_MIN_CUTOFF (default cutoff never pays for it)
+    """
+
+    keys: Tuple[str, ...]
+    acronym_ids: Tuple[int, ...]
+    categories: Tuple[str, ...]
+    names: Tuple[str, ...]
+    exact: Mapping[str, int]
+    use_ngrams: bool = False
+
+    @classmethod
+    def from_lut(
+        cls,
+        lut: Dict[str, Dict[str, List[str]]],
+        use_ngrams: Optional[bool] = None,
+    ) -> "AcronymIndex":
+        """Flatten nested lookup table (preserves category/name/acronym order).
+
+        Args:
+            lut (Dict): key: mri-category, value: {key: pulse-sequence/parameter, value: list(acronyms)}
+            use_ngrams (bool): enable n-gram prefilter (default: only if vocabulary >= NGRAM_MIN_KEYS)
+
+        Returns:
+            AcronymIndex: immutable index
+        """
+        keys: List[str] = []
+        acronyms: List[str] = []
+        categories: List[str] = []
+        names: List[str] = []
+        exact: Dict[str, int] = {}
+        for category, models in lut.items():
+            for name, words in models.items():
+                for word in words:
+                    # first occurrence wins (same tie-break as fuzzy search)
+                    exact.setdefault(exact_key(word), len(keys))
+                    keys.append(word.lower())
+                    acronyms.append(word)
+                    categories.append(category)
+                    names.append(name)
+        return cls(
+            keys=tuple(keys),
+            acronym_ids=ACRONYM_TABLE.intern_many(acronyms),
+            categories=tuple(categories),
+            names=tuple(names),
+            exact=MappingProxyType(exact),
+            use_ngrams=len(keys) >= NGRAM_MIN_KEYS if use_ngrams is None else use_ngrams,
+        )
+
+    @cached_property
+    def ngrams(self) -> NgramIndex:
+        """N-gram inverted index of keys (built on first access)."""
+        return NgramIndex.from_keys(self.keys)
+
+    @property
+    def acronyms(self) -> Tuple[str, ...]:
+        """Original vendor acronyms (resolved from string table)."""
+        return ACRONYM_TABLE.lookup(self.acronym_ids)
+
+    def __len__(self) -> int:
+        """Number of indexed acronyms."""
+        return len(self.keys)
+
+    def result(self, position: int, confidence: float, path: MatchPath) -> MatchResult:
+        """Create match result for acronym at given position."""
+        acronym = ACRONYM_TABLE[self.acronym_ids[position]]
+        return MatchResult(self.categories[position], self.names[position], acronym, confidence, path)
+
+    def prefilter(
+        self,
+        query: str,
+        cutoff: float,
+    ) -> Optional[List[int]]:
+        """Candidate positions from n-gram index, None if every acronym has to be scored."""
+        if not self.use_ngrams or cutoff < NGRAM_MIN_CUTOFF:
+            return None
+        return self.ngrams.candidates(query, cutoff)
+
+    def best_match(
+        self,
+        keyword: str,
+        cutoff: float = 0.0,
+    ) -> Optional[Tuple[int, float]]:
+        """Score keyword against every acronym (case-insensitive) in single pass.
+
+        Args:
+            keyword (str): word to search against acronym index
+            cutoff (float): threshold for matching percentage (allows n-gram prefilter, if available)
+
+        Returns:
+            tuple: position of closest acronym (int), corresponding confidence as percentage (float)
+        """
+        query = keyword.lower()
+        positions = self.prefilter(query, cutoff)
+        match: Optional[Tuple[str, float, int]]
+        if positions is None:
+            match = process.extractOne(query, self.keys, scorer=fuzz.ratio, processor=None)
+        else:
+            choices = [self.keys[i] for i in positions]
+            match = process.extractOne(query, choices, scorer=fuzz.ratio, processor=None, score_cutoff=cutoff)
+        if match is None:
+            return None
+        _, score, position = match
+        if positions is not None:
+            position = positions[position]
+        return position, round(score, 4)
+
+    def top_k(
+        self,
+        keyword: str,
+        k: int,
+        cutoff: float,
+    ) -> List[SearchResult]:
+        """Rank pulse sequences/parameters by closest acronym, candidates below cutoff are abandoned early.
+
+        Args:
+            keyword (str): word to search against acronym index
+            k (int): maximum number of results
+            cutoff (float): threshold for matching percentage (if < #.##%, candidate is dropped)
+
+        Returns:
+            list: up to k results (one per pulse sequence/parameter) ordered by highest confidence
+        """
+        results: List[SearchResult] = []
+        seen = set()
+        query = keyword.lower()
+        positions = self.prefilter(query, cutoff)
+        matches = process.extract(
+            query,
+            self.keys if positions is None else [self.keys[i] for i in positions],
+            scorer=fuzz.ratio,
+            processor=None,
+            limit=None,
+            score_cutoff=cutoff,
+        )
+        for _, score, choice in matches:
+            if len(results) == k:
+                break
+            position = choice if positions is None else positions[choice]
+            model_key = (self.categories[position], self.names[position])
+            if score <= cutoff or model_key in seen:
+                continue
+            seen.add(model_key)
+            results.append(SearchResult(*model_key, ACRONYM_TABLE[self.acronym_ids[position]], round(score, 4)))
+        return results
+
+    def lookup(
+        self,
+        keyword: str,
+        cutoff: float = 0.0,
+    ) -> Optional[Tuple[int, float, MatchPath]]:
+        """Check exact (case-insensitive) match first, fuzzy score keyword only on miss.
+
+        Args:
+            keyword (str): word to search against acronym index
+            cutoff (float): threshold for matching percentage (allows n-gram prefilter, if available)
+
+        Returns:
+            tuple: position of closest acronym (int), confidence as percentage (float), path taken (MatchPath)
+        """
+        position = self.exact.get(exact_key(keyword))
+        if position is not None:
+            return position, 100.0, MatchPath.EXACT
+        match = self.best_match(keyword, cutoff)
+        if match is None:
+            return None
+        return match[0], match[1], MatchPath.FUZZY
+
+    def best_matches(
+        self,
+        keywords: Sequence[str],
+        chunk_size: int = 4096,
+        workers: int = -1,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score batch of keywords against every acronym with multithreaded score matrix.
+
+        keywords are scored in chunks to bound score matrix memory: (chunk_size x len(index)) float64
+        (float64 scores and rounding match single keyword path 'best_match' exactly)
+
+        Args:
+            keywords (Sequence): words to search against acronym index
+            chunk_size (int): number of keywords scored per cdist() call
+            workers (int): number of threads used by cdist() (-1: all cores)
+
+        Returns:
+            tuple: per keyword position of closest acronym (np.ndarray), confidence as percentage (np.ndarray)
+        """
+        positions = np.zeros(len(keywords), dtype=np.intp)
+        scores = np.zeros(len(keywords), dtype=np.float64)
+        for start in range(0, len(keywords), chunk_size):
+            queries = [keyword.lower() for keyword in keywords[start : start + chunk_size]]
+            matrix = process.cdist(
+                queries, self.keys, scorer=fuzz.ratio, processor=None, workers=workers, dtype=np.float64
+            )
+            # first occurrence of highest similarity per row (same tie-break as extractOne)
+            best = matrix.argmax(axis=1)
+            positions[start : start + len(queries)] = best
+            scores[start : start + len(queries)] = matrix[np.arange(len(queries)), best]
+        return positions, np.array([round(score, 4) for score in scores.tolist()], dtype=np.float64)
+
+
+@lru_cache(maxsize=1)
+def get_acronym_index() -> AcronymIndex:
+    """Build index from lookup table once, reused by subsequent searches (external catalog if configured)."""
+    return AcronymIndex.from_lut(get_acronym_lut())
@@ -0,0 +1,68 @@
+"""Cross-vendor acronym translation (e.g. what does GE call Siemens' "HASTE"?).
+
+reverse index (vendor, acronym) to pulse sequence/parameter is precomputed by 'build_lookup_table.py'
+(built at runtime from external catalog if configured, see 'get_vendor_lut'),
+each lookup costs two hash lookups: acronym to model, model to target vendor acronyms
+    translate("HASTE", from_vendor="siemens", to_vendor="ge") -> ("Single-Shot FSE",)
+"""
+
+from typing import Iterable, List, Tuple
+
+from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory
+from mri_acronyms.models.validate_models import exact_key, get_vendor_lut
+from mri_acronyms.util.constants import VENDORS
+
+
+def check_vendors(*vendors: str) -> None:
+    """Raise ValueError for unknown vendor name."""
+    for vendor in vendors:
+        if vendor not in VENDORS:
+            raise ValueError(f"invalid {vendor=} not in {VENDORS}")
+
+
+def translate(
+    acronym: str,
+    from_vendor: str,
+    to_vendor: str,
+) -> Tuple[str, ...]:
+    """Translate vendor acronym to equivalent acronyms of another vendor (case-insensitive, exact match).
+
+    Args:
+        acronym (str): acronym used by source vendor (e.g. "HASTE")
+        from_vendor (str): source vendor: 'siemens', 'ge', 'philips', 'canon', 'hitachi'
+        to_vendor (str): target vendor
+
+    Returns:
+        tuple: target vendor acronyms (empty if acronym is unknown or target vendor has no equivalent)
+    """
+    check_vendors(from_vendor, to_vendor)
+    location = get_vendor_lut()[from_vendor].get(exact_key(acronym))
+    if location is None:
+        return ()
+    model = PulseSequenceCategory.get_model(*location)
+    return () if model is None else getattr(model, to_vendor)
+
+
+def translate_many(
+    acronyms: Iterable[str],
+    from_vendor: str,
+    to_vendor: str,
+) -> List[Tuple[str, ...]]:
+    """Translate batch of vendor acronyms (e.g. series descriptions of protocol export).
+
+    Args:
+        acronyms (Iterable): acronyms used by source vendor
+        from_vendor (str): source vendor: 'siemens', 'ge', 'philips', 'canon', 'hitachi'
+        to_vendor (str): target vendor
+
+    Returns:
+        list: target vendor acronyms per input acronym (input order, empty tuple if not found)
+    """
+    check_vendors(from_vendor, to_vendor)
+    reverse_index = get_vendor_lut()[from_vendor]
+    results: List[Tuple[str, ...]] = []
+    for acronym in acronyms:
+        location = reverse_index.get(exact_key(acronym))
+        model = None if location is None else PulseSequenceCategory.get_model(*location)
+        results.append(() if model is None else getattr(model, to_vendor))
+    return results
@@ -1,6 +1,7 @@
 """Grouped MR vendor acronyms by pulse sequence or scanning parameter.
 
-auto-generated by 'build_lookup_table.py' on 2024-11-20
+auto-generated by 'build_lookup_table.py' on 2026-10-17
+content-hash: 234381907d084b588a85262db5bbf7ff98fbbb9c804197869a6bfd93a74784cd
 
 vendors: "Siemens", "GE", "Philips", "Canon", "Hitachi"
 mri-category:
@@ -0,0 +1,2311 @@
+"""Reverse index of vendor acronyms to pulse sequence/parameter (cross-vendor translation).
+
+auto-generated by 'build_lookup_table.py' on 2026-10-17
+content-hash: ec340392be56d7858312ca7a83238fba00dc31165f6f0862f1c42b1967146f3b
+
+vendors: "siemens", "ge", "philips", "canon", "hitachi"
+vendor:
+    key: casefolded, sanitized vendor acronym
+    value: (category, pulse-sequence/parameter) of first occurrence in catalog
+"""
+
+VENDOR_ACRONYM_LUT = {
+    "siemens": {
+        "se": (
+            "SPIN_ECHO_SEQUENCES",
+            "spin_echo",
+        ),
+        "tse": (
+            "SPIN_ECHO_SEQUENCES",
+            "turbo_spin_echo",
+        ),
+        "turbo": (
+            "SPIN_ECHO_SEQUENCES",
+            "turbo_spin_echo",
+        ),
+        "haste": (
+            "SPIN_ECHO_SEQUENCES",
+            "single_shot_tse",
+        ),
+        "restore": (
+            "SPIN_ECHO_SEQUENCES",
+            "tse_with_restore",
+        ),
+        "space": (
+            "SPIN_ECHO_SEQUENCES",
+            "variable_flip_3d_tse",
+        ),
+        "mapit t2": (
+            "SPIN_ECHO_SEQUENCES",
+            "cartilage_mapping_tse",
+        ),
+        "dixon tse": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "dixon": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "gre": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "gradient_echo",
+        ),
+        "flash": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "rf_spoiled_incoherent_gre",
+        ),
+        "fisp": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_fid_refocusing_ssfp",
+        ),
+        "psif": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_echo_refocusing_ssfp",
+        ),
+        "truefisp": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_balanced_fid_echo_refocusing_ssfp",
+        ),
+        "ciss": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_balanced_gre_using_dual_excitation_ssfp",
+        ),
+        "dess": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_double_combined_echos_ssfp",
+        ),
+        "medic": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "spoiled_combined_multiple_fid_gre",
+        ),
+        "turboflash": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_2d_gre",
+        ),
+        "mprage": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "mp-rage": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "vibe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "volume_interpolated_fatsat_3d_gre",
+        ),
+        "t1-vibe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "volume_interpolated_fatsat_3d_gre",
+        ),
+        "dixon vibe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_3d_gre",
+        ),
+        "swi": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "susceptibility_weighted_mip_gre",
+        ),
+        "neuro perfusion": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dynamic_contrast_perfusion_gre",
+        ),
+        "mapit t2*": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "iron_concentration_mapping_gre",
+        ),
+        "ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "irm": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "turboir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "tirm": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "stir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "turbo stir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "dark fluid": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "long_tau_inversion_recovery_tse",
+        ),
+        "flair": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "long_tau_inversion_recovery_tse",
+        ),
+        "turbo flair": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "long_tau_inversion_recovery_tse",
+        ),
+        "trueir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "phase_sensitive_inversion_recovery_tse",
+        ),
+        "tir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "phase_sensitive_inversion_recovery_tse",
+        ),
+        "adc": (
+            "ECHO_PLANAR_SEQUENCES",
+            "apparent_diffusion_coefficient_map",
+        ),
+        "dwi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging",
+        ),
+        "resolve": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging_readout_segmented",
+        ),
+        "dti": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_tensor_imaging",
+        ),
+        "mddw": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_tensor_imaging",
+        ),
+        "epi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "echo_planar_imaging",
+        ),
+        "dti tractography": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "tractography": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "turbogse": (
+            "ECHO_PLANAR_SEQUENCES",
+            "turbo_gradient_spin_echo",
+        ),
+        "tgse": (
+            "ECHO_PLANAR_SEQUENCES",
+            "turbo_gradient_spin_echo",
+        ),
+        "tof": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "time_of_flight_non_contrast_mra",
+        ),
+        "pc": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "phase_contrast_non_contrast_mra",
+        ),
+        "care bolus": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "contrast_bolus_timing_ce_mra",
+        ),
+        "twist": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "dynamic_time_resolved_3d_spoiled_gre_ce_mra",
+        ),
+        "native space": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "gated_3d_t2_tse_non_contrast_mra",
+        ),
+        "native truefisp": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "dir space": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_dual_ir_3d_tse",
+        ),
+        "tfl psir": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_phase_sensitive_inversion_recovery",
+        ),
+        "myomaps": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_gre",
+        ),
+        "ti scout": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_scout",
+        ),
+        "spamm": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_tagging_gre",
+        ),
+        "cspamm": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_tagging_gre",
+        ),
+        "dante": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_tagging_gre",
+        ),
+        "bold": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_bold_2d_epi",
+        ),
+        "3d asl": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_arterial_spin_labeling",
+        ),
+        "pcasl": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_arterial_spin_labeling",
+        ),
+        "vaso": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_vaso_3d_grase",
+        ),
+        "press": (
+            "SPECTROSCOPY_SEQUENCES",
+            "point_resolved_spectroscopy",
+        ),
+        "steam": (
+            "SPECTROSCOPY_SEQUENCES",
+            "stimulated_echo_acquisition_mode",
+        ),
+        "isis": (
+            "SPECTROSCOPY_SEQUENCES",
+            "image_selected_in_vivo_spectroscopy",
+        ),
+        "csi": (
+            "SPECTROSCOPY_SEQUENCES",
+            "chemical_shift_imaging",
+        ),
+        "slice thickness": (
+            "SCANNER_PARAMETERS",
+            "slice_thickness",
+        ),
+        "distance factor": (
+            "SCANNER_PARAMETERS",
+            "distance_between_slices",
+        ),
+        "flip angle": (
+            "SCANNER_PARAMETERS",
+            "rf_excitation_pulse_gre",
+        ),
+        "flip": (
+            "SCANNER_PARAMETERS",
+            "rf_excitation_pulse_gre",
+        ),
+        "fa": (
+            "SCANNER_PARAMETERS",
+            "rf_excitation_pulse_gre",
+        ),
+        "inversion time": (
+            "SCANNER_PARAMETERS",
+            "inversion_time",
+        ),
+        "ti": (
+            "SCANNER_PARAMETERS",
+            "inversion_time",
+        ),
+        "repetition time": (
+            "SCANNER_PARAMETERS",
+            "repetition_time",
+        ),
+        "tr": (
+            "SCANNER_PARAMETERS",
+            "repetition_time",
+        ),
+        "echo time": (
+            "SCANNER_PARAMETERS",
+            "echo_time",
+        ),
+        "te": (
+            "SCANNER_PARAMETERS",
+            "echo_time",
+        ),
+        "turbo factor": (
+            "SCANNER_PARAMETERS",
+            "number_of_echos_tse",
+        ),
+        "echo spacing": (
+            "SCANNER_PARAMETERS",
+            "inter_echo_spacing_tse",
+        ),
+        "averages": (
+            "SCANNER_PARAMETERS",
+            "number_of_signal_averages",
+        ),
+        "acquisition time": (
+            "SCANNER_PARAMETERS",
+            "scan_acquisition_time",
+        ),
+        "ta": (
+            "SCANNER_PARAMETERS",
+            "scan_acquisition_time",
+        ),
+        "bandwidth": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "hz/px": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "optimized bandwidth": (
+            "SCANNER_PARAMETERS",
+            "variable_bandwidth",
+        ),
+        "mtc": (
+            "SCANNER_PARAMETERS",
+            "magnetization_transfer_contrast",
+        ),
+        "magnetization transfer": (
+            "SCANNER_PARAMETERS",
+            "magnetization_transfer_contrast",
+        ),
+        "fat sat": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical",
+        ),
+        "fs": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical",
+        ),
+        "spair": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical_adiabatic",
+        ),
+        "field of view": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "millimeters": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "fov phase": (
+            "SCANNER_PARAMETERS",
+            "field_of_view_rectangular",
+        ),
+        "rectangular fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view_rectangular",
+        ),
+        "sat region": (
+            "SCANNER_PARAMETERS",
+            "saturation_spatial",
+        ),
+        "tracking sat": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "tracking": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "multi-slab": (
+            "SCANNER_PARAMETERS",
+            "multi_slab_acquisition",
+        ),
+        "blade": (
+            "SCANNER_PARAMETERS",
+            "motion_correction_radial_kspace_filling",
+        ),
+        "blade w/ipat": (
+            "SCANNER_PARAMETERS",
+            "radial_motion_compensation_with_pat",
+        ),
+        "starvibe": (
+            "SCANNER_PARAMETERS",
+            "motion_free_breathing_3d_t1_gre",
+        ),
+        "ipat": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_image_based",
+        ),
+        "msense": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_image_based",
+        ),
+        "grappa": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_kspace_based",
+        ),
+        "deep resolve gain": (
+            "SCANNER_PARAMETERS",
+            "deep_learning_reconstruction_noise_reduction",
+        ),
+        "deep resolve sharp": (
+            "SCANNER_PARAMETERS",
+            "deep_learning_reconstruction_sharpness",
+        ),
+        "deep resolve boost": (
+            "SCANNER_PARAMETERS",
+            "deep_learning_reconstruction_scan_time",
+        ),
+        "compressed sensing": (
+            "SCANNER_PARAMETERS",
+            "compressed_sensing_kspace_sampling",
+        ),
+        "simultaneous multi-slice": (
+            "SCANNER_PARAMETERS",
+            "simultaneous_multislice",
+        ),
+        "simultaneous excitation": (
+            "SCANNER_PARAMETERS",
+            "simultaneous_multislice",
+        ),
+        "biomatrix sensor": (
+            "SCANNER_PARAMETERS",
+            "biomatrix_sensor",
+        ),
+        "off-center shift": (
+            "SCANNER_PARAMETERS",
+            "off_center_shift_slice_group",
+        ),
+        "water excitation": (
+            "SCANNER_PARAMETERS",
+            "water_excitation",
+        ),
+        "warp": (
+            "SCANNER_PARAMETERS",
+            "metal_artifact_reduction",
+        ),
+        "semac": (
+            "SCANNER_PARAMETERS",
+            "metal_artifact_reduction",
+        ),
+        "phase oversampling": (
+            "SCANNER_PARAMETERS",
+            "phase_oversampling",
+        ),
+        "oversampling": (
+            "SCANNER_PARAMETERS",
+            "frequency_oversampling",
+        ),
+        "flow comp": (
+            "SCANNER_PARAMETERS",
+            "flow_compensation",
+        ),
+        "gmr": (
+            "SCANNER_PARAMETERS",
+            "flow_compensation",
+        ),
+        "asymmetric echo": (
+            "SCANNER_PARAMETERS",
+            "partial_echo",
+        ),
+        "half fourier": (
+            "SCANNER_PARAMETERS",
+            "half_fourier",
+        ),
+        "partial fourier": (
+            "SCANNER_PARAMETERS",
+            "half_fourier",
+        ),
+        "ecg triggered": (
+            "SCANNER_PARAMETERS",
+            "gating_cardiac_ecg",
+        ),
+        "respiratory gated": (
+            "SCANNER_PARAMETERS",
+            "gating_respiratory",
+        ),
+        "prescan normalize": (
+            "SCANNER_PARAMETERS",
+            "coil_sensitivity_normalization",
+        ),
+        "petra": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_3d_half_radial",
+        ),
+        "quietx": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_optimized_gradient",
+        ),
+        "whisper": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_reduced_slew_rates",
+        ),
+        "timtx trueform": (
+            "SCANNER_PARAMETERS",
+            "parallel_multi_transmit_rf_shimming",
+        ),
+        "localizer": (
+            "SCANNER_PARAMETERS",
+            "localizer",
+        ),
+        "scout": (
+            "SCANNER_PARAMETERS",
+            "localizer",
+        ),
+        "autoalign": (
+            "SCANNER_PARAMETERS",
+            "automated_slice_positioning",
+        ),
+    },
+    "ge": {
+        "se": (
+            "SPIN_ECHO_SEQUENCES",
+            "spin_echo",
+        ),
+        "fastse": (
+            "SPIN_ECHO_SEQUENCES",
+            "turbo_spin_echo",
+        ),
+        "fse": (
+            "SPIN_ECHO_SEQUENCES",
+            "turbo_spin_echo",
+        ),
+        "single-shot fse": (
+            "SPIN_ECHO_SEQUENCES",
+            "single_shot_tse",
+        ),
+        "fast recovery fse": (
+            "SPIN_ECHO_SEQUENCES",
+            "tse_with_restore",
+        ),
+        "frfse": (
+            "SPIN_ECHO_SEQUENCES",
+            "tse_with_restore",
+        ),
+        "cube": (
+            "SPIN_ECHO_SEQUENCES",
+            "variable_flip_3d_tse",
+        ),
+        "cartigram": (
+            "SPIN_ECHO_SEQUENCES",
+            "cartilage_mapping_tse",
+        ),
+        "ideal": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "flex": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "gre": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "gradient_echo",
+        ),
+        "spgr": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "rf_spoiled_incoherent_gre",
+        ),
+        "spoiled gradient echo": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "rf_spoiled_incoherent_gre",
+        ),
+        "grass": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_fid_refocusing_ssfp",
+        ),
+        "ssfp": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_echo_refocusing_ssfp",
+        ),
+        "fiesta": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_balanced_fid_echo_refocusing_ssfp",
+        ),
+        "fiesta-c": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_balanced_gre_using_dual_excitation_ssfp",
+        ),
+        "mensa": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_double_combined_echos_ssfp",
+        ),
+        "merge": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "spoiled_combined_multiple_fid_gre",
+        ),
+        "cosmic": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "spoiled_combined_multiple_fid_gre",
+        ),
+        "fast gre": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_2d_gre",
+        ),
+        "fast spgr": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_2d_gre",
+        ),
+        "bravo": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "3d fgre": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "3d fast spgr": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "fame": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "volume_interpolated_fatsat_3d_gre",
+        ),
+        "lava-xv": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "volume_interpolated_fatsat_3d_gre",
+        ),
+        "lava-flex": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_3d_gre",
+        ),
+        "swan": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "susceptibility_weighted_mip_gre",
+        ),
+        "brainstat": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dynamic_contrast_perfusion_gre",
+        ),
+        "star map": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "iron_concentration_mapping_gre",
+        ),
+        "ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "fse-ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "fastir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "stir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "fast stir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "flair": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "long_tau_inversion_recovery_tse",
+        ),
+        "adc": (
+            "ECHO_PLANAR_SEQUENCES",
+            "apparent_diffusion_coefficient_map",
+        ),
+        "dwi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging",
+        ),
+        "propeller dwi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging_readout_segmented",
+        ),
+        "dti": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_tensor_imaging",
+        ),
+        "epi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "echo_planar_imaging",
+        ),
+        "fibertrak": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "fiber": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "tracking": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "tof": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "time_of_flight_non_contrast_mra",
+        ),
+        "inhance inflow": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "time_of_flight_non_contrast_mra",
+        ),
+        "pc": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "phase_contrast_non_contrast_mra",
+        ),
+        "inhance velocity": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "phase_contrast_non_contrast_mra",
+        ),
+        "smart prep": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "contrast_bolus_timing_ce_mra",
+        ),
+        "tricks": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "dynamic_time_resolved_3d_spoiled_gre_ce_mra",
+        ),
+        "tricks-xv": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "dynamic_time_resolved_3d_spoiled_gre_ce_mra",
+        ),
+        "inflow deltaflow": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "gated_3d_t2_tse_non_contrast_mra",
+        ),
+        "inflow irp": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "inhance inflow ir": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "cube dir": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_dual_ir_3d_tse",
+        ),
+        "cardiomaps": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_gre",
+        ),
+        "cine ir": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_scout",
+        ),
+        "harp": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_tagging_gre",
+        ),
+        "dense": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_tagging_gre",
+        ),
+        "senc": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_tagging_gre",
+        ),
+        "bold": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_bold_2d_epi",
+        ),
+        "3d asl": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_arterial_spin_labeling",
+        ),
+        "pcasl": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_arterial_spin_labeling",
+        ),
+        "vaso": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_vaso_3d_grase",
+        ),
+        "press": (
+            "SPECTROSCOPY_SEQUENCES",
+            "point_resolved_spectroscopy",
+        ),
+        "steam": (
+            "SPECTROSCOPY_SEQUENCES",
+            "stimulated_echo_acquisition_mode",
+        ),
+        "isis": (
+            "SPECTROSCOPY_SEQUENCES",
+            "image_selected_in_vivo_spectroscopy",
+        ),
+        "probe csi": (
+            "SPECTROSCOPY_SEQUENCES",
+            "chemical_shift_imaging",
+        ),
+        "slice thickness": (
+            "SCANNER_PARAMETERS",
+            "slice_thickness",
+        ),
+        "slice gap": (
+            "SCANNER_PARAMETERS",
+            "distance_between_slices",
+        ),
+        "flip angle": (
+            "SCANNER_PARAMETERS",
+            "rf_excitation_pulse_gre",
+        ),
+        "ti": (
+            "SCANNER_PARAMETERS",
+            "inversion_time",
+        ),
+        "tr": (
+            "SCANNER_PARAMETERS",
+            "repetition_time",
+        ),
+        "te": (
+            "SCANNER_PARAMETERS",
+            "echo_time",
+        ),
+        "echo train length": (
+            "SCANNER_PARAMETERS",
+            "number_of_echos_tse",
+        ),
+        "etl": (
+            "SCANNER_PARAMETERS",
+            "number_of_echos_tse",
+        ),
+        "echo spacing": (
+            "SCANNER_PARAMETERS",
+            "inter_echo_spacing_tse",
+        ),
+        "nex": (
+            "SCANNER_PARAMETERS",
+            "number_of_signal_averages",
+        ),
+        "acquisition time": (
+            "SCANNER_PARAMETERS",
+            "scan_acquisition_time",
+        ),
+        "receive bandwidth": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "khz": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "variable bandwidth": (
+            "SCANNER_PARAMETERS",
+            "variable_bandwidth",
+        ),
+        "mtc": (
+            "SCANNER_PARAMETERS",
+            "magnetization_transfer_contrast",
+        ),
+        "fat sat": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical",
+        ),
+        "chem sat": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical",
+        ),
+        "aspir": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical_adiabatic",
+        ),
+        "field-of-view": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "millimeters": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "asymmetric fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view_rectangular",
+        ),
+        "asymmetric": (
+            "SCANNER_PARAMETERS",
+            "field_of_view_rectangular",
+        ),
+        "sat": (
+            "SCANNER_PARAMETERS",
+            "saturation_spatial",
+        ),
+        "walking sat": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "walking": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "motsa": (
+            "SCANNER_PARAMETERS",
+            "multi_slab_acquisition",
+        ),
+        "propeller": (
+            "SCANNER_PARAMETERS",
+            "motion_correction_radial_kspace_filling",
+        ),
+        "propeller w/asset": (
+            "SCANNER_PARAMETERS",
+            "radial_motion_compensation_with_pat",
+        ),
+        "disco star": (
+            "SCANNER_PARAMETERS",
+            "motion_free_breathing_3d_t1_gre",
+        ),
+        "asset": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_image_based",
+        ),
+        "arc": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_kspace_based",
+        ),
+        "air recon dl": (
+            "SCANNER_PARAMETERS",
+            "deep_learning_reconstruction_sharpness",
+        ),
+        "hypersense": (
+            "SCANNER_PARAMETERS",
+            "compressed_sensing_kspace_sampling",
+        ),
+        "phase offset multiplanar": (
+            "SCANNER_PARAMETERS",
+            "simultaneous_multislice",
+        ),
+        "pomp": (
+            "SCANNER_PARAMETERS",
+            "simultaneous_multislice",
+        ),
+        "off center fov": (
+            "SCANNER_PARAMETERS",
+            "off_center_shift_slice_group",
+        ),
+        "off-center": (
+            "SCANNER_PARAMETERS",
+            "off_center_shift_slice_group",
+        ),
+        "water excitation": (
+            "SCANNER_PARAMETERS",
+            "water_excitation",
+        ),
+        "mavric": (
+            "SCANNER_PARAMETERS",
+            "metal_artifact_reduction",
+        ),
+        "no phase wrap": (
+            "SCANNER_PARAMETERS",
+            "phase_oversampling",
+        ),
+        "anti-aliasing": (
+            "SCANNER_PARAMETERS",
+            "frequency_oversampling",
+        ),
+        "flow comp": (
+            "SCANNER_PARAMETERS",
+            "flow_compensation",
+        ),
+        "asymmetric echo": (
+            "SCANNER_PARAMETERS",
+            "partial_echo",
+        ),
+        "half nex": (
+            "SCANNER_PARAMETERS",
+            "half_fourier",
+        ),
+        "fractional nex": (
+            "SCANNER_PARAMETERS",
+            "half_fourier",
+        ),
+        "cardiac gated": (
+            "SCANNER_PARAMETERS",
+            "gating_cardiac_ecg",
+        ),
+        "respiratory comp": (
+            "SCANNER_PARAMETERS",
+            "gating_respiratory",
+        ),
+        "pure": (
+            "SCANNER_PARAMETERS",
+            "coil_sensitivity_normalization",
+        ),
+        "silenz": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_3d_half_radial",
+        ),
+        "silent scan": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_optimized_gradient",
+        ),
+        "acoustic reduction technology": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_reduced_slew_rates",
+        ),
+        "art": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_reduced_slew_rates",
+        ),
+        "multidrive": (
+            "SCANNER_PARAMETERS",
+            "parallel_multi_transmit_rf_shimming",
+        ),
+        "localizer": (
+            "SCANNER_PARAMETERS",
+            "localizer",
+        ),
+        "readybrain": (
+            "SCANNER_PARAMETERS",
+            "automated_slice_positioning",
+        ),
+        "airx": (
+            "SCANNER_PARAMETERS",
+            "automated_slice_positioning",
+        ),
+    },
+    "philips": {
+        "se": (
+            "SPIN_ECHO_SEQUENCES",
+            "spin_echo",
+        ),
+        "tse": (
+            "SPIN_ECHO_SEQUENCES",
+            "turbo_spin_echo",
+        ),
+        "single-shot tse": (
+            "SPIN_ECHO_SEQUENCES",
+            "single_shot_tse",
+        ),
+        "drive": (
+            "SPIN_ECHO_SEQUENCES",
+            "tse_with_restore",
+        ),
+        "vista": (
+            "SPIN_ECHO_SEQUENCES",
+            "variable_flip_3d_tse",
+        ),
+        "cartilage assessment": (
+            "SPIN_ECHO_SEQUENCES",
+            "cartilage_mapping_tse",
+        ),
+        "mdixon xd": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "mdixon tse": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "fast field echo": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "gradient_echo",
+        ),
+        "ffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "gradient_echo",
+        ),
+        "t1-ffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "rf_spoiled_incoherent_gre",
+        ),
+        "t2*-ffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_fid_refocusing_ssfp",
+        ),
+        "t2-ffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_echo_refocusing_ssfp",
+        ),
+        "balanced ffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_balanced_fid_echo_refocusing_ssfp",
+        ),
+        "b-ffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_balanced_fid_echo_refocusing_ssfp",
+        ),
+        "m-ffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "spoiled_combined_multiple_fid_gre",
+        ),
+        "tfe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_2d_gre",
+        ),
+        "3d-t1 tfe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "3d tfe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "thrive": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "volume_interpolated_fatsat_3d_gre",
+        ),
+        "mdixon": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_3d_gre",
+        ),
+        "swip": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "susceptibility_weighted_mip_gre",
+        ),
+        "swi-phase": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "susceptibility_weighted_mip_gre",
+        ),
+        "presto": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dynamic_contrast_perfusion_gre",
+        ),
+        "t2* perfusion": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dynamic_contrast_perfusion_gre",
+        ),
+        "mdixon-quant": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "iron_concentration_mapping_gre",
+        ),
+        "ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "ir-tse": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "stir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "stir tse": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "flair": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "long_tau_inversion_recovery_tse",
+        ),
+        "real ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "phase_sensitive_inversion_recovery_tse",
+        ),
+        "adc": (
+            "ECHO_PLANAR_SEQUENCES",
+            "apparent_diffusion_coefficient_map",
+        ),
+        "dwi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging",
+        ),
+        "dwi with segmented epi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging_readout_segmented",
+        ),
+        "dti": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_tensor_imaging",
+        ),
+        "epi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "echo_planar_imaging",
+        ),
+        "fibertrak": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "trak": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "grase": (
+            "ECHO_PLANAR_SEQUENCES",
+            "turbo_gradient_spin_echo",
+        ),
+        "inflow": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "time_of_flight_non_contrast_mra",
+        ),
+        "pc": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "phase_contrast_non_contrast_mra",
+        ),
+        "bolustrak": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "contrast_bolus_timing_ce_mra",
+        ),
+        "keyhole": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "dynamic_time_resolved_3d_spoiled_gre_ce_mra",
+        ),
+        "4d trak": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "dynamic_time_resolved_3d_spoiled_gre_ce_mra",
+        ),
+        "trance": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "gated_3d_t2_tse_non_contrast_mra",
+        ),
+        "b-trance": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "b trance": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "dual ir-tse": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_dual_ir_3d_tse",
+        ),
+        "triple ir-tse": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_triple_ir_3d_tse",
+        ),
+        "btfe ssh": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_phase_sensitive_inversion_recovery",
+        ),
+        "t1 mapping": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_gre",
+        ),
+        "starquant": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_gre",
+        ),
+        "bold": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_bold_2d_epi",
+        ),
+        "asl specialist": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_arterial_spin_labeling",
+        ),
+        "vaso": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_vaso_3d_grase",
+        ),
+        "press": (
+            "SPECTROSCOPY_SEQUENCES",
+            "point_resolved_spectroscopy",
+        ),
+        "steam": (
+            "SPECTROSCOPY_SEQUENCES",
+            "stimulated_echo_acquisition_mode",
+        ),
+        "isis": (
+            "SPECTROSCOPY_SEQUENCES",
+            "image_selected_in_vivo_spectroscopy",
+        ),
+        "spectroscopy": (
+            "SPECTROSCOPY_SEQUENCES",
+            "chemical_shift_imaging",
+        ),
+        "slice thickness": (
+            "SCANNER_PARAMETERS",
+            "slice_thickness",
+        ),
+        "gap": (
+            "SCANNER_PARAMETERS",
+            "distance_between_slices",
+        ),
+        "flip angle": (
+            "SCANNER_PARAMETERS",
+            "rf_excitation_pulse_gre",
+        ),
+        "ti": (
+            "SCANNER_PARAMETERS",
+            "inversion_time",
+        ),
+        "tr": (
+            "SCANNER_PARAMETERS",
+            "repetition_time",
+        ),
+        "te": (
+            "SCANNER_PARAMETERS",
+            "echo_time",
+        ),
+        "turbo factor": (
+            "SCANNER_PARAMETERS",
+            "number_of_echos_tse",
+        ),
+        "echo spacing": (
+            "SCANNER_PARAMETERS",
+            "inter_echo_spacing_tse",
+        ),
+        "nsa": (
+            "SCANNER_PARAMETERS",
+            "number_of_signal_averages",
+        ),
+        "acquisition time": (
+            "SCANNER_PARAMETERS",
+            "scan_acquisition_time",
+        ),
+        "fat/water shift": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "px": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "optimized bandwidth": (
+            "SCANNER_PARAMETERS",
+            "variable_bandwidth",
+        ),
+        "mtc": (
+            "SCANNER_PARAMETERS",
+            "magnetization_transfer_contrast",
+        ),
+        "spir": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical",
+        ),
+        "spair": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical_adiabatic",
+        ),
+        "fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "centimeters": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "rectangular fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view_rectangular",
+        ),
+        "rectangular": (
+            "SCANNER_PARAMETERS",
+            "field_of_view_rectangular",
+        ),
+        "rest": (
+            "SCANNER_PARAMETERS",
+            "saturation_spatial",
+        ),
+        "travel rest": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "travel": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "multi-chunk": (
+            "SCANNER_PARAMETERS",
+            "multi_slab_acquisition",
+        ),
+        "multivane": (
+            "SCANNER_PARAMETERS",
+            "motion_correction_radial_kspace_filling",
+        ),
+        "vane xd": (
+            "SCANNER_PARAMETERS",
+            "motion_free_breathing_3d_t1_gre",
+        ),
+        "sense": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_image_based",
+        ),
+        "ds sense": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_image_based",
+        ),
+        "smartspeed": (
+            "SCANNER_PARAMETERS",
+            "deep_learning_reconstruction_scan_time",
+        ),
+        "compressed sense": (
+            "SCANNER_PARAMETERS",
+            "compressed_sensing_kspace_sampling",
+        ),
+        "multi-slice": (
+            "SCANNER_PARAMETERS",
+            "simultaneous_multislice",
+        ),
+        "off-center fov": (
+            "SCANNER_PARAMETERS",
+            "off_center_shift_slice_group",
+        ),
+        "proset": (
+            "SCANNER_PARAMETERS",
+            "water_excitation",
+        ),
+        "o-mar": (
+            "SCANNER_PARAMETERS",
+            "metal_artifact_reduction",
+        ),
+        "fold-over suppression": (
+            "SCANNER_PARAMETERS",
+            "phase_oversampling",
+        ),
+        "frequency oversampling": (
+            "SCANNER_PARAMETERS",
+            "frequency_oversampling",
+        ),
+        "flow comp": (
+            "SCANNER_PARAMETERS",
+            "flow_compensation",
+        ),
+        "flag": (
+            "SCANNER_PARAMETERS",
+            "flow_compensation",
+        ),
+        "partial echo": (
+            "SCANNER_PARAMETERS",
+            "partial_echo",
+        ),
+        "half scan": (
+            "SCANNER_PARAMETERS",
+            "half_fourier",
+        ),
+        "ecg triggered": (
+            "SCANNER_PARAMETERS",
+            "gating_cardiac_ecg",
+        ),
+        "vcg": (
+            "SCANNER_PARAMETERS",
+            "gating_cardiac_ecg",
+        ),
+        "trigger": (
+            "SCANNER_PARAMETERS",
+            "gating_respiratory",
+        ),
+        "pear": (
+            "SCANNER_PARAMETERS",
+            "gating_respiratory",
+        ),
+        "clear": (
+            "SCANNER_PARAMETERS",
+            "coil_sensitivity_normalization",
+        ),
+        "comfortone": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_optimized_gradient",
+        ),
+        "softone": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_reduced_slew_rates",
+        ),
+        "multitransmit": (
+            "SCANNER_PARAMETERS",
+            "parallel_multi_transmit_rf_shimming",
+        ),
+        "plan scan": (
+            "SCANNER_PARAMETERS",
+            "localizer",
+        ),
+        "smartexam": (
+            "SCANNER_PARAMETERS",
+            "automated_slice_positioning",
+        ),
+    },
+    "canon": {
+        "se": (
+            "SPIN_ECHO_SEQUENCES",
+            "spin_echo",
+        ),
+        "fastse": (
+            "SPIN_ECHO_SEQUENCES",
+            "turbo_spin_echo",
+        ),
+        "fase": (
+            "SPIN_ECHO_SEQUENCES",
+            "single_shot_tse",
+        ),
+        "t2 plus fse": (
+            "SPIN_ECHO_SEQUENCES",
+            "tse_with_restore",
+        ),
+        "fase3d mvox": (
+            "SPIN_ECHO_SEQUENCES",
+            "variable_flip_3d_tse",
+        ),
+        "multi echo t2": (
+            "SPIN_ECHO_SEQUENCES",
+            "cartilage_mapping_tse",
+        ),
+        "water fat separation": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "wfs tse": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "field echo": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "gradient_echo",
+        ),
+        "fe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "gradient_echo",
+        ),
+        "t1-ffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "rf_spoiled_incoherent_gre",
+        ),
+        "ssfp-c": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_fid_refocusing_ssfp",
+        ),
+        "ssfp": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_echo_refocusing_ssfp",
+        ),
+        "true ssfp": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_balanced_fid_echo_refocusing_ssfp",
+        ),
+        "mecho": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "spoiled_combined_multiple_fid_gre",
+        ),
+        "dual 3d": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "spoiled_combined_multiple_fid_gre",
+        ),
+        "mpffe": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_2d_gre",
+        ),
+        "fastfe 3d": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "3dffe-ir": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "3d quick": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "volume_interpolated_fatsat_3d_gre",
+        ),
+        "wfs": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_3d_gre",
+        ),
+        "flow sensitive black blood": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "susceptibility_weighted_mip_gre",
+        ),
+        "fsbb": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "susceptibility_weighted_mip_gre",
+        ),
+        "ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "faststir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "fastflair": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "long_tau_inversion_recovery_tse",
+        ),
+        "real ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "phase_sensitive_inversion_recovery_tse",
+        ),
+        "adc": (
+            "ECHO_PLANAR_SEQUENCES",
+            "apparent_diffusion_coefficient_map",
+        ),
+        "dwi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging",
+        ),
+        "fase dwi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging_readout_segmented",
+        ),
+        "dti": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_tensor_imaging",
+        ),
+        "epi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "echo_planar_imaging",
+        ),
+        "dtt": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "hybrid epi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "turbo_gradient_spin_echo",
+        ),
+        "tof": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "time_of_flight_non_contrast_mra",
+        ),
+        "pc": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "phase_contrast_non_contrast_mra",
+        ),
+        "visualprep": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "contrast_bolus_timing_ce_mra",
+        ),
+        "drks": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "dynamic_time_resolved_3d_spoiled_gre_ce_mra",
+        ),
+        "fbi": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "gated_3d_t2_tse_non_contrast_mra",
+        ),
+        "cia": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "gated_3d_t2_tse_non_contrast_mra",
+        ),
+        "time-slip": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "tsa": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "double ir": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_dual_ir_3d_tse",
+        ),
+        "triple ir": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_triple_ir_3d_tse",
+        ),
+        "molli": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_gre",
+        ),
+        "sasha": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_gre",
+        ),
+        "look-locker": (
+            "CARDIAC_SEQUENCES",
+            "myocardial_t1_mapping_gre",
+        ),
+        "bold": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_bold_2d_epi",
+        ),
+        "astar": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_arterial_spin_labeling",
+        ),
+        "vaso": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_vaso_3d_grase",
+        ),
+        "press": (
+            "SPECTROSCOPY_SEQUENCES",
+            "point_resolved_spectroscopy",
+        ),
+        "steam": (
+            "SPECTROSCOPY_SEQUENCES",
+            "stimulated_echo_acquisition_mode",
+        ),
+        "isis": (
+            "SPECTROSCOPY_SEQUENCES",
+            "image_selected_in_vivo_spectroscopy",
+        ),
+        "csi": (
+            "SPECTROSCOPY_SEQUENCES",
+            "chemical_shift_imaging",
+        ),
+        "slice thickness": (
+            "SCANNER_PARAMETERS",
+            "slice_thickness",
+        ),
+        "gap": (
+            "SCANNER_PARAMETERS",
+            "distance_between_slices",
+        ),
+        "flip angle": (
+            "SCANNER_PARAMETERS",
+            "rf_excitation_pulse_gre",
+        ),
+        "ti": (
+            "SCANNER_PARAMETERS",
+            "inversion_time",
+        ),
+        "tr": (
+            "SCANNER_PARAMETERS",
+            "repetition_time",
+        ),
+        "te": (
+            "SCANNER_PARAMETERS",
+            "echo_time",
+        ),
+        "echo factor": (
+            "SCANNER_PARAMETERS",
+            "number_of_echos_tse",
+        ),
+        "echo spacing": (
+            "SCANNER_PARAMETERS",
+            "inter_echo_spacing_tse",
+        ),
+        "naq": (
+            "SCANNER_PARAMETERS",
+            "number_of_signal_averages",
+        ),
+        "acquisition time": (
+            "SCANNER_PARAMETERS",
+            "scan_acquisition_time",
+        ),
+        "bandwidth": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "hz/px": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "matched bandwidth": (
+            "SCANNER_PARAMETERS",
+            "variable_bandwidth",
+        ),
+        "sors-stc": (
+            "SCANNER_PARAMETERS",
+            "magnetization_transfer_contrast",
+        ),
+        "msoft": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical",
+        ),
+        "spair": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical_adiabatic",
+        ),
+        "fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "millimeters": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "rectangular fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view_rectangular",
+        ),
+        "presat": (
+            "SCANNER_PARAMETERS",
+            "saturation_spatial",
+        ),
+        "moving presat": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "moving": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "multi-slab": (
+            "SCANNER_PARAMETERS",
+            "multi_slab_acquisition",
+        ),
+        "jet": (
+            "SCANNER_PARAMETERS",
+            "motion_correction_radial_kspace_filling",
+        ),
+        "quickstar": (
+            "SCANNER_PARAMETERS",
+            "motion_free_breathing_3d_t1_gre",
+        ),
+        "speeder": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_image_based",
+        ),
+        "advanced intelligent clear-iq engine": (
+            "SCANNER_PARAMETERS",
+            "deep_learning_reconstruction_noise_reduction",
+        ),
+        "aice": (
+            "SCANNER_PARAMETERS",
+            "deep_learning_reconstruction_noise_reduction",
+        ),
+        "compressed speeder": (
+            "SCANNER_PARAMETERS",
+            "compressed_sensing_kspace_sampling",
+        ),
+        "quadscan": (
+            "SCANNER_PARAMETERS",
+            "simultaneous_multislice",
+        ),
+        "phase frequency shift": (
+            "SCANNER_PARAMETERS",
+            "off_center_shift_slice_group",
+        ),
+        "pasta": (
+            "SCANNER_PARAMETERS",
+            "water_excitation",
+        ),
+        "vat": (
+            "SCANNER_PARAMETERS",
+            "metal_artifact_reduction",
+        ),
+        "phase wrap suppression": (
+            "SCANNER_PARAMETERS",
+            "phase_oversampling",
+        ),
+        "frequency wrap suppression": (
+            "SCANNER_PARAMETERS",
+            "frequency_oversampling",
+        ),
+        "flow comp": (
+            "SCANNER_PARAMETERS",
+            "flow_compensation",
+        ),
+        "fc": (
+            "SCANNER_PARAMETERS",
+            "flow_compensation",
+        ),
+        "match bandwidth": (
+            "SCANNER_PARAMETERS",
+            "partial_echo",
+        ),
+        "afi": (
+            "SCANNER_PARAMETERS",
+            "half_fourier",
+        ),
+        "cardiac gated": (
+            "SCANNER_PARAMETERS",
+            "gating_cardiac_ecg",
+        ),
+        "respiratory gated": (
+            "SCANNER_PARAMETERS",
+            "gating_respiratory",
+        ),
+        "mute 3d t1": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_3d_half_radial",
+        ),
+        "rounded gradient shapes": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_optimized_gradient",
+        ),
+        "pianissimo zen": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_reduced_slew_rates",
+        ),
+        "multiphase transmit": (
+            "SCANNER_PARAMETERS",
+            "parallel_multi_transmit_rf_shimming",
+        ),
+        "locator": (
+            "SCANNER_PARAMETERS",
+            "localizer",
+        ),
+        "cardioline": (
+            "SCANNER_PARAMETERS",
+            "automated_slice_positioning",
+        ),
+        "neuroline": (
+            "SCANNER_PARAMETERS",
+            "automated_slice_positioning",
+        ),
+        "spineline": (
+            "SCANNER_PARAMETERS",
+            "automated_slice_positioning",
+        ),
+    },
+    "hitachi": {
+        "se": (
+            "SPIN_ECHO_SEQUENCES",
+            "spin_echo",
+        ),
+        "fastse": (
+            "SPIN_ECHO_SEQUENCES",
+            "turbo_spin_echo",
+        ),
+        "single-shot fse": (
+            "SPIN_ECHO_SEQUENCES",
+            "single_shot_tse",
+        ),
+        "driven equilibrium": (
+            "SPIN_ECHO_SEQUENCES",
+            "tse_with_restore",
+        ),
+        "de-fse": (
+            "SPIN_ECHO_SEQUENCES",
+            "tse_with_restore",
+        ),
+        "de-fir": (
+            "SPIN_ECHO_SEQUENCES",
+            "tse_with_restore",
+        ),
+        "isofse": (
+            "SPIN_ECHO_SEQUENCES",
+            "variable_flip_3d_tse",
+        ),
+        "t2 relax map": (
+            "SPIN_ECHO_SEQUENCES",
+            "cartilage_mapping_tse",
+        ),
+        "fatsep": (
+            "SPIN_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_tse",
+        ),
+        "ge": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "gradient_echo",
+        ),
+        "rf spoiled sarge": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "rf_spoiled_incoherent_gre",
+        ),
+        "rssg": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "rf_spoiled_incoherent_gre",
+        ),
+        "rephased sarge": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_fid_refocusing_ssfp",
+        ),
+        "time-reversed sarge": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_echo_refocusing_ssfp",
+        ),
+        "trsg": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_echo_refocusing_ssfp",
+        ),
+        "balanced sarge": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_balanced_fid_echo_refocusing_ssfp",
+        ),
+        "basg": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_gre_with_balanced_fid_echo_refocusing_ssfp",
+        ),
+        "phase balanced sarge": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_balanced_gre_using_dual_excitation_ssfp",
+        ),
+        "pbsg": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "coherent_balanced_gre_using_dual_excitation_ssfp",
+        ),
+        "adage": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "spoiled_combined_multiple_fid_gre",
+        ),
+        "frssg": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_2d_gre",
+        ),
+        "3d-geir": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "ultrafast_rf_spoiled_incoherent_3d_gre",
+        ),
+        "tigre": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "volume_interpolated_fatsat_3d_gre",
+        ),
+        "fatsep rssg": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dixon_water_fat_separation_3d_gre",
+        ),
+        "bsi": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "susceptibility_weighted_mip_gre",
+        ),
+        "ce-perfusion": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "dynamic_contrast_perfusion_gre",
+        ),
+        "t2* relaxmap": (
+            "GRADIENT_ECHO_SEQUENCES",
+            "iron_concentration_mapping_gre",
+        ),
+        "ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "fir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "inversion_recovery_tse",
+        ),
+        "fir-stir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "fast stir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "short_tau_inversion_recovery_tse",
+        ),
+        "fir-flair": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "long_tau_inversion_recovery_tse",
+        ),
+        "fastflair": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "long_tau_inversion_recovery_tse",
+        ),
+        "real-ir": (
+            "INVERSION_RECOVERY_SEQUENCES",
+            "phase_sensitive_inversion_recovery_tse",
+        ),
+        "adc": (
+            "ECHO_PLANAR_SEQUENCES",
+            "apparent_diffusion_coefficient_map",
+        ),
+        "dwi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging",
+        ),
+        "radar dwi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_weighted_imaging_readout_segmented",
+        ),
+        "dti": (
+            "ECHO_PLANAR_SEQUENCES",
+            "diffusion_tensor_imaging",
+        ),
+        "epi": (
+            "ECHO_PLANAR_SEQUENCES",
+            "echo_planar_imaging",
+        ),
+        "dti tractography": (
+            "ECHO_PLANAR_SEQUENCES",
+            "fiber_tracking",
+        ),
+        "tof": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "time_of_flight_non_contrast_mra",
+        ),
+        "pc-mra": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "phase_contrast_non_contrast_mra",
+        ),
+        "flute": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "contrast_bolus_timing_ce_mra",
+        ),
+        "traq": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "dynamic_time_resolved_3d_spoiled_gre_ce_mra",
+        ),
+        "vasc-fse": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "gated_3d_t2_tse_non_contrast_mra",
+        ),
+        "vasc": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "vasc-asl": (
+            "ANGIOGRAPHY_SEQUENCES",
+            "inflow_enhanced_ssfp_3d_non_contrast_mra",
+        ),
+        "bold": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_bold_2d_epi",
+        ),
+        "asl perfusion": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_arterial_spin_labeling",
+        ),
+        "vaso": (
+            "FUNCTIONAL_SEQUENCES",
+            "fmri_vaso_3d_grase",
+        ),
+        "press": (
+            "SPECTROSCOPY_SEQUENCES",
+            "point_resolved_spectroscopy",
+        ),
+        "steam": (
+            "SPECTROSCOPY_SEQUENCES",
+            "stimulated_echo_acquisition_mode",
+        ),
+        "isis": (
+            "SPECTROSCOPY_SEQUENCES",
+            "image_selected_in_vivo_spectroscopy",
+        ),
+        "csi": (
+            "SPECTROSCOPY_SEQUENCES",
+            "chemical_shift_imaging",
+        ),
+        "slice thickness": (
+            "SCANNER_PARAMETERS",
+            "slice_thickness",
+        ),
+        "slice interval": (
+            "SCANNER_PARAMETERS",
+            "distance_between_slices",
+        ),
+        "flip angle": (
+            "SCANNER_PARAMETERS",
+            "rf_excitation_pulse_gre",
+        ),
+        "ti": (
+            "SCANNER_PARAMETERS",
+            "inversion_time",
+        ),
+        "tr": (
+            "SCANNER_PARAMETERS",
+            "repetition_time",
+        ),
+        "te": (
+            "SCANNER_PARAMETERS",
+            "echo_time",
+        ),
+        "echo factor": (
+            "SCANNER_PARAMETERS",
+            "number_of_echos_tse",
+        ),
+        "inter-echo time": (
+            "SCANNER_PARAMETERS",
+            "inter_echo_spacing_tse",
+        ),
+        "iet": (
+            "SCANNER_PARAMETERS",
+            "inter_echo_spacing_tse",
+        ),
+        "nsa": (
+            "SCANNER_PARAMETERS",
+            "number_of_signal_averages",
+        ),
+        "scan time": (
+            "SCANNER_PARAMETERS",
+            "scan_acquisition_time",
+        ),
+        "receiver bandwidth": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "khz": (
+            "SCANNER_PARAMETERS",
+            "receiver_bandwidth",
+        ),
+        "variable bandwidth": (
+            "SCANNER_PARAMETERS",
+            "variable_bandwidth",
+        ),
+        "mtc": (
+            "SCANNER_PARAMETERS",
+            "magnetization_transfer_contrast",
+        ),
+        "sinc": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical",
+        ),
+        "h-sinc": (
+            "SCANNER_PARAMETERS",
+            "fatsat_chemical",
+        ),
+        "fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "millimeters": (
+            "SCANNER_PARAMETERS",
+            "field_of_view",
+        ),
+        "rectangular-fov": (
+            "SCANNER_PARAMETERS",
+            "field_of_view_rectangular",
+        ),
+        "presat": (
+            "SCANNER_PARAMETERS",
+            "saturation_spatial",
+        ),
+        "sequential pre sat": (
+            "SCANNER_PARAMETERS",
+            "saturation_pulse_moving",
+        ),
+        "multi-slab": (
+            "SCANNER_PARAMETERS",
+            "multi_slab_acquisition",
+        ),
+        "radar": (
+            "SCANNER_PARAMETERS",
+            "motion_correction_radial_kspace_filling",
+        ),
+        "rapid-radar": (
+            "SCANNER_PARAMETERS",
+            "radial_motion_compensation_with_pat",
+        ),
+        "tigre navi": (
+            "SCANNER_PARAMETERS",
+            "motion_free_breathing_3d_t1_gre",
+        ),
+        "rapid": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_image_based",
+        ),
+        "k-rapid": (
+            "SCANNER_PARAMETERS",
+            "parallel_imaging_technique_kspace_based",
+        ),
+        "dual-slice": (
+            "SCANNER_PARAMETERS",
+            "simultaneous_multislice",
+        ),
+        "off-center fov": (
+            "SCANNER_PARAMETERS",
+            "off_center_shift_slice_group",
+        ),
+        "water excitation": (
+            "SCANNER_PARAMETERS",
+            "water_excitation",
+        ),
+        "himar": (
+            "SCANNER_PARAMETERS",
+            "metal_artifact_reduction",
+        ),
+        "anti-wrap": (
+            "SCANNER_PARAMETERS",
+            "phase_oversampling",
+        ),
+        "frequency oversampling": (
+            "SCANNER_PARAMETERS",
+            "frequency_oversampling",
+        ),
+        "rephase": (
+            "SCANNER_PARAMETERS",
+            "flow_compensation",
+        ),
+        "half echo": (
+            "SCANNER_PARAMETERS",
+            "partial_echo",
+        ),
+        "half scan": (
+            "SCANNER_PARAMETERS",
+            "half_fourier",
+        ),
+        "ecg triggered": (
+            "SCANNER_PARAMETERS",
+            "gating_cardiac_ecg",
+        ),
+        "mar": (
+            "SCANNER_PARAMETERS",
+            "gating_respiratory",
+        ),
+        "natural": (
+            "SCANNER_PARAMETERS",
+            "coil_sensitivity_normalization",
+        ),
+        "softsound": (
+            "SCANNER_PARAMETERS",
+            "quiet_scanning_reduced_slew_rates",
+        ),
+        "quartet": (
+            "SCANNER_PARAMETERS",
+            "parallel_multi_transmit_rf_shimming",
+        ),
+        "scanogram": (
+            "SCANNER_PARAMETERS",
+            "localizer",
+        ),
+        "autopose brain": (
+            "SCANNER_PARAMETERS",
+            "automated_slice_positioning",
+        ),
+    },
+}
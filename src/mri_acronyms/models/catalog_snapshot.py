@@ -0,0 +1,186 @@
+"""Binary snapshot of validated catalog (skips pydantic validation at startup).
+
+snapshot is keyed by content hash of data sources (pulse_sequences, models, constants):
+    match: models are restored without validation (pydantic 'model_construct')
+    mismatch/missing: caller falls back to importing (validating) pulse_sequences modules or external catalog file
+
+file layout: header pickle followed by one pickled section per (section, category)
+    header: version, content hash, byte offset and length of every section (checked before any section is read)
+    compact section: name and vendor acronyms per model (runtime lookup view, see 'runtime_catalog.py')
+    model section: all fields (only read if full pydantic models are requested)
+reading one category seeks to its section (cost is independent of other categories),
+sections hold JSON-compatible values only (no pydantic/pydantic_core objects) and are not cached,
+callers keep what they build from them
+
+https://docs.pydantic.dev/latest/concepts/models/#creating-models-without-validation
+"""
+
+import hashlib
+import pickle
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Final, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pydantic
+from pydantic import HttpUrl, TypeAdapter
+
+from mri_acronyms.models.catalog_loader import catalog_path
+from mri_acronyms.models.pydantic_models import MriParameterModel, MriSequenceModel
+from mri_acronyms.util.constants import VENDORS
+from mri_acronyms.util.file_utils import atomic_path
+from mri_acronyms.util.logger import init_logger, relative_size
+
+log = init_logger(caller=__file__)
+
+SNAPSHOT_VERSION: Final[int] = 4
+PACKAGE_PATH: Final[Path] = Path(__file__).resolve().parent.parent
+SNAPSHOT_PATH: Final[Path] = Path(PACKAGE_PATH, "lut", "catalog_snapshot.pickle")
+MODEL_TYPES: Final[Dict[str, type[MriParameterModel]]] = {
+    model.__name__: model for model in (MriParameterModel, MriSequenceModel)
+}
+
+URL_ADAPTER: Final[TypeAdapter[HttpUrl]] = TypeAdapter(HttpUrl)
+
+# section kinds (stored once per category)
+COMPACT_SECTION: Final[str] = "compact"
+MODEL_SECTION: Final[str] = "models"
+
+# (model class name, set fields, field values in JSON mode)
+ModelRecord = Tuple[str, List[str], Dict[str, Any]]
+
+
+def source_files() -> List[Path]:
+    """Python sources (and external catalog file, if configured) which define catalog content and validation rules."""
+    external = catalog_path()
+    return [
+        *sorted(Path(PACKAGE_PATH, "pulse_sequences").glob("*.py")),
+        Path(PACKAGE_PATH, "models", "pydantic_models.py"),
+        Path(PACKAGE_PATH, "util", "constants.py"),
+        *([external] if external is not None else []),
+    ]
+
+
+@lru_cache(maxsize=1)
+def source_digest() -> str:
+    """SHA-256 content hash of catalog sources (includes snapshot format, python and pydantic versions)."""
+    sha = hashlib.sha256(f"{SNAPSHOT_VERSION}|{sys.version_info[:2]}|{pydantic.VERSION}".encode())
+    for path in source_files():
+        sha.update((path.relative_to(PACKAGE_PATH) if path.is_relative_to(PACKAGE_PATH) else path).as_posix().encode())
+        sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def save_snapshot(
+    catalog: Mapping[str, Sequence[Union[MriParameterModel, MriSequenceModel]]],
+    path: Path = SNAPSHOT_PATH,
+) -> bool:
+    """Save validated models to binary snapshot.
+
+    Args:
+        catalog (Mapping): key: category name, value: validated models
+        path (Path): destination file path (with extension)
+
+    Returns:
+        True if file was written successfully
+    """
+    sections: Dict[Tuple[str, str], bytes] = {}
+    for category, models in catalog.items():
+        compact = [model.model_dump(mode="json", include={"name", *VENDORS}) for model in models]
+        records = [
+            (type(model).__name__, sorted(model.model_fields_set), model.model_dump(mode="json")) for model in models
+        ]
+        sections[(COMPACT_SECTION, category)] = pickle.dumps(compact, protocol=pickle.HIGHEST_PROTOCOL)
+        sections[(MODEL_SECTION, category)] = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+    # offsets are relative to end of header
+    offsets: Dict[Tuple[str, str], Tuple[int, int]] = {}
+    position = 0
+    for key, data in sections.items():
+        offsets[key] = (position, len(data))
+        position += len(data)
+    header = {"version": SNAPSHOT_VERSION, "digest": source_digest(), "sections": offsets}
+    with atomic_path(path) as tmp_path, tmp_path.open("wb") as file:
+        pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+        for data in sections.values():
+            file.write(data)
+    if path.is_file():
+        log.info(f"saved: {relative_size(path)}")
+        return True
+    return False
+
+
+def read_header(file: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Snapshot header, None if snapshot format or content hash does not match current sources."""
+    header = pickle.load(file)
+    if not isinstance(header, dict) or header.get("version") != SNAPSHOT_VERSION:
+        return None
+    if header.get("digest") != source_digest():
+        return None
+    return header
+
+
+def is_current(path: Path = SNAPSHOT_PATH) -> bool:
+    """Check snapshot exists and matches current catalog sources (only header is read)."""
+    if not path.is_file():
+        return False
+    try:
+        with path.open("rb") as file:
+            return read_header(file) is not None
+    except Exception:
+        log.exception(f"{relative_size(path)}")
+        return False
+
+
+def read_section(path: Path, section: str, category: str) -> Any:
+    """Section of one category, None if snapshot is missing, unreadable, stale or has no such section.
+
+    Args:
+        path (Path): snapshot file path
+        section (str): COMPACT_SECTION or MODEL_SECTION
+        category (str): category name
+
+    Returns:
+        section rows of category
+    """
+    if not path.is_file():
+        return None
+    try:
+        with path.open("rb") as file:
+            header = read_header(file)
+            if header is None or (section, category) not in header["sections"]:
+                return None
+            offset, length = header["sections"][(section, category)]
+            file.seek(file.tell() + offset)
+            return pickle.loads(file.read(length))
+    except Exception:
+        # unreadable snapshot is never fatal, caller falls back to validating catalog sources
+        log.exception(f"{relative_size(path)}")
+        return None
+
+
+def load_compact_snapshot(category: str, path: Path = SNAPSHOT_PATH) -> Optional[List[Dict[str, Any]]]:
+    """Load name and vendor acronyms of category models, None if snapshot is missing, unreadable or stale.
+
+    Returns:
+        list: model fields (name, vendor acronyms)
+    """
+    return read_section(path=path, section=COMPACT_SECTION, category=category)
+
+
+def load_snapshot(category: str, path: Path = SNAPSHOT_PATH) -> Optional[List[ModelRecord]]:
+    """Load snapshot records of category, None if snapshot is missing, unreadable or stale (content hash mismatch).
+
+    Returns:
+        list: model records (restored with 'restore_models')
+    """
+    return read_section(path=path, section=MODEL_SECTION, category=category)
+
+
+def restore_models(records: Sequence[ModelRecord]) -> List[Union[MriParameterModel, MriSequenceModel]]:
+    """Rebuild previously validated models without running field validators (url is parsed back to 'HttpUrl')."""
+    return [
+        MODEL_TYPES[kind].model_construct(
+            _fields_set=set(fields_set), **{**fields, "url": URL_ADAPTER.validate_python(fields["url"])}
+        )
+        for kind, fields_set, fields in records
+    ]
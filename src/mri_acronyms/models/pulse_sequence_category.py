@@ -4,19 +4,16 @@ https://radiopaedia.org/articles/mri-pulse-sequence-abbreviations
 https://sandrofenelon.com.br/mri-acronyms-ge-siemens-philips-toshiba-canon-hitachi/
 """
 
+import importlib
 from enum import Enum, auto, unique
-from typing import Optional, Sequence, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+from mri_acronyms.models.catalog_loader import catalog_path, load_catalog
+from mri_acronyms.models.catalog_snapshot import load_compact_snapshot, load_snapshot, restore_models
 from mri_acronyms.models.pydantic_models import MriParameterModel, MriSequenceModel
-from mri_acronyms.pulse_sequences.angiography import MRA_PULSE_SEQUENCES
-from mri_acronyms.pulse_sequences.cardiac import CARDIAC_PULSE_SEQUENCES
-from mri_acronyms.pulse_sequences.echo_planar import EPI_PULSE_SEQUENCES
-from mri_acronyms.pulse_sequences.functional import FMRI_PULSE_SEQUENCES
-from mri_acronyms.pulse_sequences.gradient_echo import GRE_PULSE_SEQUENCES
-from mri_acronyms.pulse_sequences.inversion_recovery import IR_PULSE_SEQUENCES
-from mri_acronyms.pulse_sequences.scanner_parameters import MRI_PARAMETERS
-from mri_acronyms.pulse_sequences.spectroscopy import SPECT_PULSE_SEQUENCES
-from mri_acronyms.pulse_sequences.spin_echo import SE_PULSE_SEQUENCES
+from mri_acronyms.models.runtime_catalog import CompactModel, compact_models
+from mri_acronyms.util.constants import VENDORS
 
 
 @unique
@@ -44,34 +41,98 @@ class PulseSequenceCategory(Enum):
 
     @property
     # pylint: disable=[too-many-return-statements]
-    def acronyms(self) -> Sequence[Union[MriParameterModel, MriSequenceModel]]:
-        """Mapping of category string to relevant key/value pairs."""
+    def source(self) -> Tuple[str, str]:
+        """Module and variable name defining relevant key/value pairs."""
         match self:
             case PulseSequenceCategory.SPIN_ECHO_SEQUENCES:
-                return SE_PULSE_SEQUENCES
+                return "mri_acronyms.pulse_sequences.spin_echo", "SE_PULSE_SEQUENCES"
             case PulseSequenceCategory.GRADIENT_ECHO_SEQUENCES:
-                return GRE_PULSE_SEQUENCES
+                return "mri_acronyms.pulse_sequences.gradient_echo", "GRE_PULSE_SEQUENCES"
             case PulseSequenceCategory.INVERSION_RECOVERY_SEQUENCES:
-                return IR_PULSE_SEQUENCES
+                return "mri_acronyms.pulse_sequences.inversion_recovery", "IR_PULSE_SEQUENCES"
             case PulseSequenceCategory.ECHO_PLANAR_SEQUENCES:
-                return EPI_PULSE_SEQUENCES
+                return "mri_acronyms.pulse_sequences.echo_planar", "EPI_PULSE_SEQUENCES"
             case PulseSequenceCategory.ANGIOGRAPHY_SEQUENCES:
-                return MRA_PULSE_SEQUENCES
+                return "mri_acronyms.pulse_sequences.angiography", "MRA_PULSE_SEQUENCES"
             case PulseSequenceCategory.CARDIAC_SEQUENCES:
-                return CARDIAC_PULSE_SEQUENCES
+                return "mri_acronyms.pulse_sequences.cardiac", "CARDIAC_PULSE_SEQUENCES"
             case PulseSequenceCategory.SPECTROSCOPY_SEQUENCES:
-                return SPECT_PULSE_SEQUENCES
+                return "mri_acronyms.pulse_sequences.spectroscopy", "SPECT_PULSE_SEQUENCES"
             case PulseSequenceCategory.FUNCTIONAL_SEQUENCES:
-                return FMRI_PULSE_SEQUENCES
+                return "mri_acronyms.pulse_sequences.functional", "FMRI_PULSE_SEQUENCES"
             case PulseSequenceCategory.SCANNER_PARAMETERS:
-                return MRI_PARAMETERS
+                return "mri_acronyms.pulse_sequences.scanner_parameters", "MRI_PARAMETERS"
+
+    @property
+    def acronyms(self) -> Sequence[Union[MriParameterModel, MriSequenceModel]]:
+        """Mapping of category string to relevant key/value pairs (loaded on first access)."""
+        return load_acronyms(self)
+
+    def get_full_model(self, name: str) -> Optional[Union[MriParameterModel, MriSequenceModel]]:
+        """Validated pydantic model of category by case insensitive name (loads category on first access)."""
+        return get_category_models(self).get(name.lower())
 
     @staticmethod
-    def get_model(category: str, name: str) -> Optional[Union[MriParameterModel, MriSequenceModel]]:
-        """Lookup acronym model by case insensitive keyword search."""
-        for psc in PulseSequenceCategory:
-            if category.lower() == psc.name.lower():
-                for model in psc.acronyms:
-                    if name.lower() == model.name.lower():
-                        return model
-        return None
+    def get_model(category: str, name: str) -> Optional[CompactModel]:
+        """Lookup compact (read-only) acronym model by case insensitive keyword search."""
+        psc = CATEGORY_BY_NAME.get(category.lower())
+        if psc is None:
+            return None
+        return get_compact_models(psc).get(name.lower())
+
+    @staticmethod
+    def get_models(pairs: Iterable[Tuple[str, str]]) -> List[Optional[CompactModel]]:
+        """Bulk lookup of compact acronym models by case insensitive (category, name) pairs."""
+        return [PulseSequenceCategory.get_model(category, name) for category, name in pairs]
+
+
+# first level of model index: lowercase category to enumeration
+CATEGORY_BY_NAME: Dict[str, PulseSequenceCategory] = {psc.name.lower(): psc for psc in PulseSequenceCategory}
+
+
+def read_acronyms(category: PulseSequenceCategory) -> Sequence[Union[MriParameterModel, MriSequenceModel]]:
+    """Restore category from validated snapshot, otherwise load external catalog file or module (validates models).
+
+    external catalog file is only used if configured (environment variable MRI_ACRONYMS_CATALOG)
+    """
+    records = load_snapshot(category.name)
+    if records is not None:
+        return restore_models(records)
+    path = catalog_path()
+    if path is not None:
+        return load_catalog(path, tuple(PulseSequenceCategory.__members__)).get(category.name, [])
+    module, variable = category.source
+    return getattr(importlib.import_module(module), variable)
+
+
+@lru_cache(maxsize=None)
+def load_acronyms(category: PulseSequenceCategory) -> Sequence[Union[MriParameterModel, MriSequenceModel]]:
+    """Validated models of category (loaded once with 'read_acronyms', cached for later access)."""
+    return read_acronyms(category)
+
+
+@lru_cache(maxsize=None)
+def get_category_models(category: PulseSequenceCategory) -> Dict[str, Union[MriParameterModel, MriSequenceModel]]:
+    """Second level of model index (built on first access of category).
+
+    Returns:
+        key: lowercase name, value: model
+    """
+    return {model.name.lower(): model for model in category.acronyms}
+
+
+@lru_cache(maxsize=None)
+def get_compact_models(category: PulseSequenceCategory) -> Dict[str, CompactModel]:
+    """Runtime view of category (read from snapshot compact table without creating pydantic models if available).
+
+    only compact section of category is read (released once records are built), without snapshot records are
+    built from uncached 'read_acronyms' (validated models are not kept by 'load_acronyms')
+
+    Returns:
+        key: lowercase name, value: compact model
+    """
+    fields = load_compact_snapshot(category.name)
+    if fields is not None:
+        return compact_models(category, fields)
+    models = read_acronyms(category)
+    return compact_models(category, (model.model_dump(include={"name", *VENDORS}) for model in models))
@@ -0,0 +1,116 @@
+"""Compact read-only view of catalog used on lookup path (name, category and vendor acronyms only).
+
+pydantic models carry validated urls, descriptions and sequence extras which lookups never read,
+full models are only created on demand ('CompactModel.to_model').
+vendor acronyms are stored as ids of shared string table (each distinct acronym is stored once).
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, Union
+
+from mri_acronyms.models.pydantic_models import MriParameterModel, MriSequenceModel
+from mri_acronyms.util.constants import VENDORS
+from mri_acronyms.util.string_table import ACRONYM_TABLE
+
+if TYPE_CHECKING:
+    # runtime import would be circular (categories build compact records)
+    from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory
+
+
+class CompactModel:
+    """Immutable pulse sequence/parameter record (vendor acronyms stored as string table ids)."""
+
+    __slots__ = ("category", "name", "vendor_ids")
+
+    category: "PulseSequenceCategory"
+    name: str
+    # acronym ids per vendor (order of VENDORS)
+    vendor_ids: Tuple[Tuple[int, ...], ...]
+
+    def __init__(self, category: "PulseSequenceCategory", name: str, **vendors: Iterable[str]) -> None:
+        """Create record (acronyms are interned in 'ACRONYM_TABLE').
+
+        Args:
+            category (PulseSequenceCategory): categorical grouping
+            name (str): pulse sequence/parameter name (snake_case)
+            vendors (Iterable): acronyms per vendor ('siemens', 'ge', 'philips', 'canon', 'hitachi')
+        """
+        object.__setattr__(self, "category", category)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(
+            self, "vendor_ids", tuple(ACRONYM_TABLE.intern_many(vendors.get(vendor, ())) for vendor in VENDORS)
+        )
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """Records are read-only."""
+        raise AttributeError(f"{self.__class__.__name__} is read-only: cannot set {key!r}")
+
+    def __delattr__(self, key: str) -> None:
+        """Records are read-only."""
+        raise AttributeError(f"{self.__class__.__name__} is read-only: cannot delete {key!r}")
+
+    def __reduce__(self) -> Tuple[Callable[..., "CompactModel"], Tuple[Any, ...]]:
+        """Rebuild from strings on copy/unpickle (acronym ids are only valid within current process)."""
+        fields = {"name": self.name, **{vendor: getattr(self, vendor) for vendor in VENDORS}}
+        return self.__class__.from_fields, (self.category, fields)
+
+    def __repr__(self) -> str:
+        """String representation of class."""
+        vendors = ", ".join(f"{vendor}={getattr(self, vendor)!r}" for vendor in VENDORS)
+        return f"{self.__class__.__name__}(category={self.category.name!r}, name={self.name!r}, {vendors})"
+
+    @property
+    def siemens(self) -> Tuple[str, ...]:
+        """Siemens acronyms."""
+        return ACRONYM_TABLE.lookup(self.vendor_ids[0])
+
+    @property
+    def ge(self) -> Tuple[str, ...]:
+        """General Electric acronyms."""
+        return ACRONYM_TABLE.lookup(self.vendor_ids[1])
+
+    @property
+    def philips(self) -> Tuple[str, ...]:
+        """Philips acronyms."""
+        return ACRONYM_TABLE.lookup(self.vendor_ids[2])
+
+    @property
+    def canon(self) -> Tuple[str, ...]:
+        """Canon acronyms."""
+        return ACRONYM_TABLE.lookup(self.vendor_ids[3])
+
+    @property
+    def hitachi(self) -> Tuple[str, ...]:
+        """Hitachi acronyms."""
+        return ACRONYM_TABLE.lookup(self.vendor_ids[4])
+
+    @property
+    def acronym_ids(self) -> FrozenSet[int]:
+        """Distinct acronym ids of every vendor (e.g. for set operations between models)."""
+        return frozenset(string_id for ids in self.vendor_ids for string_id in ids)
+
+    @classmethod
+    def from_fields(cls, category: "PulseSequenceCategory", fields: Mapping[str, Any]) -> "CompactModel":
+        """Create record from model fields (validated model dump or snapshot record, no pydantic objects)."""
+        return cls(category, fields["name"], **{vendor: fields.get(vendor, ()) for vendor in VENDORS})
+
+    @property
+    def acronyms(self) -> Tuple[str, ...]:
+        """Vendor acronyms of every vendor (catalog order: siemens, ge, philips, canon, hitachi)."""
+        return ACRONYM_TABLE.lookup(string_id for ids in self.vendor_ids for string_id in ids)
+
+    def to_model(self) -> Optional[Union[MriParameterModel, MriSequenceModel]]:
+        """Full validated pydantic model (category is loaded on first access)."""
+        return self.category.get_full_model(self.name)
+
+
+def compact_models(category: "PulseSequenceCategory", records: Iterable[Mapping[str, Any]]) -> Dict[str, CompactModel]:
+    """Index records of category.
+
+    Args:
+        category (PulseSequenceCategory): categorical grouping
+        records (Iterable): model fields (name, vendor acronyms)
+
+    Returns:
+        key: lowercase name, value: compact record
+    """
+    return {record["name"].lower(): CompactModel.from_fields(category, record) for record in records}
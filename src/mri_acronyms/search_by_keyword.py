@@ -1,23 +1,37 @@
-"""Search for given MRI pulse sequence / parameter category based on keyword."""
+"""Search for given MRI pulse sequence / parameter category based on keyword.
 
+streaming mode: reads one keyword per line (file or stdin), writes one JSON object per keyword to stdout
+    cat keywords.txt | python search_by_keyword.py - > matches.jsonl
+"""
+
+import argparse
+import json
 import random
 import string
-from typing import Any, Dict, List, Tuple, Union
-
-from english_words import get_english_words_set
-from rapidfuzz import fuzz
-
-from mri_acronyms.lut.category_to_acronym_lut import CATEGORY_TO_ACRONYM_LUT
-from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory
-from mri_acronyms.models.pydantic_models import MriParameterModel, MriSequenceModel
-from mri_acronyms.util.constants import VALID_SYMBOLS
-from mri_acronyms.util.logger import init_logger
+import sys
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from mri_acronyms.index.acronym_index import MatchPath, MatchResult, SearchResult, exact_key, get_acronym_index
+from mri_acronyms.models.runtime_catalog import CompactModel
+from mri_acronyms.models.validate_models import get_acronym_lut
+from mri_acronyms.util.constants import LOOKUP_CACHE_SIZE, MISS_LOG_SAMPLE_RATE, STREAM_CHUNK_SIZE, VALID_SYMBOLS
+from mri_acronyms.util.logger import SamplingFilter, init_logger
+from mri_acronyms.util.lru_cache import CacheStats, LruCache
 
 ASCII_LETTERS = list(string.ascii_letters + string.digits + VALID_SYMBOLS)
-ENGLISH_WORDS = list(get_english_words_set(sources=["web2"], alpha=True, lower=False))
 
 
 log = init_logger(caller=__file__)
+# keyword misses are logged to child logger, sampled to limit volume
+MISS_LOG_SAMPLER = SamplingFilter(rate=MISS_LOG_SAMPLE_RATE)
+miss_log = log.getChild("misses")
+miss_log.addFilter(MISS_LOG_SAMPLER)
+
+# memoized index lookups: key: (normalized keyword, cutoff), value: (position, confidence, path) or None
+LOOKUP_CACHE = LruCache(maxsize=LOOKUP_CACHE_SIZE)
+_UNCACHED = object()
 
 
 def create_random_text(
@@ -29,9 +43,18 @@ def create_random_text(
     return result
 
 
+@lru_cache(maxsize=1)
+def get_english_words() -> List[str]:
+    """Load english dictionary corpus (~235k words) on first use, only needed for random samples."""
+    # deferred: corpus import is slow and not needed by matcher
+    from english_words import get_english_words_set  # noqa: PLC0415
+
+    return list(get_english_words_set(sources=["web2"], alpha=True, lower=False))
+
+
 def create_random_word() -> str:
     """Create random english word."""
-    return random.choice(ENGLISH_WORDS)
+    return random.choice(get_english_words())
 
 
 # pylint: disable=[unused-variable]
@@ -60,8 +83,8 @@ def get_valid_words() -> List[str]:
         list: subset words
     """
     mixed_case_words = []
-    for category in CATEGORY_TO_ACRONYM_LUT.keys():
-        for acronyms in CATEGORY_TO_ACRONYM_LUT[category].values():
+    for models in get_acronym_lut().values():
+        for acronyms in models.values():
             for acronym in acronyms:
                 # intentionally create mixed case words
                 options = [
@@ -98,71 +121,226 @@ def get_sample(
 def match_words():
     """Wrapper to generate sample data."""
     for keyword in get_sample(sample_size=20, include_random=True):
-        match_acronym(keyword=keyword)
+        print_match(keyword=keyword)
+
+
+def configure_miss_logging(sample_rate: float) -> None:
+    """Set share of keyword misses which are logged (0.0: none, 1.0: all)."""
+    MISS_LOG_SAMPLER.rate = sample_rate
+
+
+def configure_cache(maxsize: int) -> None:
+    """Resize keyword lookup cache (0 disables caching)."""
+    LOOKUP_CACHE.resize(maxsize=maxsize)
+
+
+def cache_stats() -> CacheStats:
+    """Keyword lookup cache hits, misses, evictions and current size."""
+    return LOOKUP_CACHE.stats()
+
+
+def clear_cache() -> None:
+    """Remove cached keyword lookups and reset statistics."""
+    LOOKUP_CACHE.clear()
 
 
-def find_closest_match(
+def cached_lookup(
     keyword: str,
-    acronyms: List,
-) -> Tuple[str, float]:
-    """Use fuzzy pattern matching (case insensitive) to find closest match.
+    cutoff: float,
+) -> Optional[Tuple[int, float, MatchPath]]:
+    """Memoized acronym index lookup (keyword is normalized to lowercase).
+
+    Args:
+        keyword (str): word to search against acronym index
+        cutoff (float): threshold for matching percentage (part of cache key)
 
     Returns:
-        tuple: acronym found in list (string), corresponding confidence as percentage (float)
+        tuple: position of closest acronym (int), confidence as percentage (float), path taken (MatchPath)
     """
-    confidences = []
-    for acronym in acronyms:
-        fuzz_ratio = round(fuzz.ratio(s1=keyword.lower(), s2=acronym.lower()), 4)
-        confidences.append(fuzz_ratio)
-    # get index to element in list with highest similarity match
-    match = confidences.index(max(confidences))
-    return acronyms[match], confidences[match]
+    key = (keyword.lower(), cutoff)
+    match = LOOKUP_CACHE.get(key, default=_UNCACHED)
+    if match is _UNCACHED:
+        match = get_acronym_index().lookup(keyword, cutoff)
+        LOOKUP_CACHE.put(key, match)
+    return match
 
 
-def match_acronym(keyword: str, cutoff: float = 70.0) -> Union[MriParameterModel, MriSequenceModel, None]:
-    """Perform case-insensitive search by keyword.
+def lookup_acronym(
+    keyword: str,
+    cutoff: float = 70.0,
+) -> Optional[MatchResult]:
+    """Perform case-insensitive search by keyword (no output or logging side effects).
 
     Args:
         keyword (str): word to search against acronym list
         cutoff (float): threshold for matching percentage (if < #.##%, no match is found)
 
     Returns:
-        if match is found: returns relevant MRI pulse sequence/parameter model
+        if match is found: matched acronym, confidence and path taken (model is resolved on access)
     """
-    model = None
-    results: Dict[str, Any] = {
+    if not isinstance(keyword, str) or len(keyword) < 2:
+        return None
+    match = cached_lookup(keyword, cutoff)
+    if match is None or match[1] <= cutoff:
+        return None
+    return get_acronym_index().result(*match)
+
+
+def match_acronym(keyword: str, cutoff: float = 70.0) -> Optional[CompactModel]:
+    """Perform case-insensitive search by keyword (misses are logged, subject to sampling rate).
+
+    Args:
+        keyword (str): word to search against acronym list
+        cutoff (float): threshold for matching percentage (if < #.##%, no match is found)
+
+    Returns:
+        if match is found: returns relevant MRI pulse sequence/parameter model (compact, read-only)
+    """
+    result = lookup_acronym(keyword=keyword, cutoff=cutoff)
+    if result is None:
+        # lazy arguments: message is only formatted for misses which pass sampling filter
+        miss_log.error("%-32s\t cutoff=%0.2f%%\t no match", keyword, cutoff)
+        return None
+    return result.model
+
+
+def print_match(keyword: str, cutoff: float = 70.0) -> Optional[MatchResult]:
+    """Presentation wrapper (demo): display matched model, log misses."""
+    result = lookup_acronym(keyword=keyword, cutoff=cutoff)
+    if result is None:
+        miss_log.error("%-32s\t cutoff=%0.2f%%\t no match", keyword, cutoff)
+    else:
+        print(
+            f"MATCH: {keyword:32s}\t confidence={result.confidence:0.2f}%\t path={result.path!s:5s}\t {result.model=}"
+        )
+    return result
+
+
+def search(
+    keyword: str,
+    k: int = 5,
+    cutoff: float = 70.0,
+) -> List[SearchResult]:
+    """Perform case-insensitive search by keyword, return k best pulse sequences/parameters.
+
+    ambiguous matches can be flagged by margin between best and runner-up confidence
+
+    Args:
+        keyword (str): word to search against acronym list
+        k (int): maximum number of results
+        cutoff (float): threshold for matching percentage (if < #.##%, candidate is dropped)
+
+    Returns:
+        list: up to k results ordered by highest confidence (empty if no match is found)
+    """
+    if not isinstance(keyword, str) or len(keyword) < 2 or k < 1:
+        return []
+    return get_acronym_index().top_k(keyword, k=k, cutoff=cutoff)
+
+
+def match_acronyms(
+    keywords: Sequence[str],
+    cutoff: float = 70.0,
+    workers: int = -1,
+) -> List[Optional[MatchResult]]:
+    """Perform case-insensitive search for batch of keywords (scored in parallel across all cores).
+
+    exact matches are resolved by hash lookup, only remaining keywords are fuzzy scored
+
+    Args:
+        keywords (Sequence): words to search against acronym list
+        cutoff (float): threshold for matching percentage (if < #.##%, no match is found)
+        workers (int): number of threads used for fuzzy scoring (-1: all cores)
+
+    Returns:
+        list: per keyword (in input order), if match is found: MatchResult otherwise None
+    """
+    index = get_acronym_index()
+    results: List[Optional[MatchResult]] = [None] * len(keywords)
+    misses = []
+    for i, keyword in enumerate(keywords):
+        if isinstance(keyword, str) and len(keyword) > 1:
+            position = index.exact.get(exact_key(keyword))
+            if position is None:
+                misses.append(i)
+            elif cutoff < 100.0:
+                results[i] = index.result(position, 100.0, MatchPath.EXACT)
+    positions, scores = index.best_matches([keywords[i] for i in misses], workers=workers)
+    for i, position, confidence in zip(misses, positions.tolist(), scores.tolist()):
+        if cutoff < confidence:
+            results[i] = index.result(position, confidence, MatchPath.FUZZY)
+    return results
+
+
+def read_keywords(lines: Iterable[str]) -> Iterator[str]:
+    """Lazily yield one keyword per line (surrounding whitespace removed)."""
+    for line in lines:
+        yield line.strip()
+
+
+def chunked(keywords: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Split stream of keywords into lists of (at most) given size."""
+    iterator = iter(keywords)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def to_record(
+    keyword: str,
+    match: Optional[MatchResult],
+) -> Dict[str, Any]:
+    """Convert match to JSON serializable record (null values if no match is found)."""
+    if match is None:
+        return {"keyword": keyword, "category": None, "name": None, "confidence": None, "path": None}
+    return {
         "keyword": keyword,
-        "candidates": [],
+        "category": match.category,
+        "name": match.name,
+        "confidence": match.confidence,
+        "path": str(match.path),
     }
-    if isinstance(keyword, str) and len(keyword) > 1:
-        for category in CATEGORY_TO_ACRONYM_LUT.keys():
-            for name, acronyms in CATEGORY_TO_ACRONYM_LUT[category].items():
-                acronym, confidence = find_closest_match(keyword, acronyms)
-                results["candidates"].append(
-                    {
-                        "category": category,
-                        "name": name,
-                        "acronym": acronym,
-                        "confidence": confidence,
-                    }
-                )
-                # optimization: skip scanning once identical match is found
-                if confidence == 100.0:
-                    break
-    # find highest confidence in candidates
-    scores = [result["confidence"] for result in results["candidates"]]
-    match = scores.index(max(scores))
-    confidence = results["candidates"][match]["confidence"]
-    if cutoff < confidence:
-        model = PulseSequenceCategory.get_model(
-            category=results["candidates"][match]["category"],
-            name=results["candidates"][match]["name"],
-        )
-        print(f"MATCH: {keyword:32s}\t {confidence=:0.2f}%\t {model=}")
+
+
+def stream_matches(
+    lines: Iterable[str],
+    output: TextIO,
+    cutoff: float = 70.0,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> int:
+    """Match keywords in bounded chunks, write results as JSON lines (constant memory).
+
+    Args:
+        lines (Iterable): one keyword per line (e.g. open file or sys.stdin)
+        output (TextIO): destination of JSON lines
+        cutoff (float): threshold for matching percentage (if < #.##%, no match is found)
+        chunk_size (int): number of keywords matched per batch
+
+    Returns:
+        int: number of keywords processed
+    """
+    count = 0
+    for chunk in chunked(read_keywords(lines), size=chunk_size):
+        for keyword, match in zip(chunk, match_acronyms(keywords=chunk, cutoff=cutoff)):
+            output.write(json.dumps(to_record(keyword, match)) + "\n")
+        count += len(chunk)
+    return count
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point: stream keywords from file/stdin, otherwise match random sample."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", nargs="?", help="file with one keyword per line ('-' for stdin)")
+    parser.add_argument("--cutoff", type=float, default=70.0, help="threshold for matching percentage")
+    parser.add_argument("--chunk-size", type=int, default=STREAM_CHUNK_SIZE, help="keywords matched per batch")
+    args = parser.parse_args(argv)
+    if args.input is None:
+        match_words()
+    elif args.input == "-":
+        stream_matches(sys.stdin, sys.stdout, cutoff=args.cutoff, chunk_size=args.chunk_size)
     else:
-        log.error(f"{keyword:32s}\t {confidence=:0.2f}%\t {model=}")
-    return model
+        with open(args.input, encoding="utf-8", errors="replace") as lines:
+            stream_matches(lines, sys.stdout, cutoff=args.cutoff, chunk_size=args.chunk_size)
 
 
 if __name__ == "__main__":
-    match_words()
+    main()
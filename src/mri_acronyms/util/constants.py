@@ -4,6 +4,14 @@ from typing import Dict, Final, List
 
 SEP: Final[str] = "; "
 VALID_SYMBOLS: Final[str] = ".-|/*"
+# vendor acronym fields of pulse sequence/parameter models
+VENDORS: Final[List[str]] = ["siemens", "ge", "philips", "canon", "hitachi"]
+# maximum number of memoized keyword lookups
+LOOKUP_CACHE_SIZE: Final[int] = 4096
+# share of keyword misses written to log (0.0: none, 1.0: all)
+MISS_LOG_SAMPLE_RATE: Final[float] = 1.0
+# number of keywords matched per batch when streaming input
+STREAM_CHUNK_SIZE: Final[int] = 4096
 
 HEADERS: Final[List[str]] = [
     "Group",
@@ -0,0 +1,73 @@
+"""Content hashing and atomic file replacement for generated outputs (lookup table, reports).
+
+outputs are written to temporary file in destination folder, then renamed over previous version:
+    concurrent readers either see complete previous or complete new file (never missing/partial)
+
+https://docs.python.org/3/library/os.html#os.replace
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+def content_hash(*parts: Any) -> str:
+    """SHA-256 hash of JSON serializable content (order sensitive, tuples hashed as lists).
+
+    Args:
+        parts (Any): content which determines generated output (e.g. catalog rows, format options)
+
+    Returns:
+        str: hex digest
+    """
+    payload = json.dumps(parts, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def read_sidecar_hash(path: Path) -> Optional[str]:
+    """Content hash stored next to output file ('<name>.sha256'), None if output or hash is missing."""
+    sidecar = sidecar_path(path)
+    if not path.is_file() or not sidecar.is_file():
+        return None
+    return sidecar.read_text(encoding="utf-8").strip() or None
+
+
+def sidecar_path(path: Path) -> Path:
+    """Location of content hash for output file."""
+    return path.with_name(f"{path.name}.sha256")
+
+
+@contextmanager
+def atomic_path(path: Path) -> Iterator[Path]:
+    """Temporary path in destination folder, renamed to destination once block exits without error.
+
+    Args:
+        path (Path): destination file path (with extension), parent folder is created if not exists
+
+    Returns:
+        Path: temporary file path to write to (removed on error)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        yield tmp_path
+        # mkstemp creates owner-only files, keep permissions of replaced file (default: rw-r--r--)
+        tmp_path.chmod(path.stat().st_mode & 0o777 if path.is_file() else 0o644)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def write_atomic(
+    path: Path,
+    data: str,
+) -> None:
+    """Replace text file content atomically (utf-8, unix line endings)."""
+    with atomic_path(path) as tmp_path:
+        tmp_path.write_text(data, encoding="utf-8", newline="\n")
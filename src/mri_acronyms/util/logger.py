@@ -1,8 +1,12 @@
 """Logging module."""
 
+import atexit
 import logging
+import queue
+import random
 import sys
-from logging.handlers import TimedRotatingFileHandler
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Final
 
@@ -32,19 +36,32 @@ def relative_size(
     return f"{relative_path} {get_readable_size(path)}"
 
 
-def init_logger(
-    caller: str,
-) -> logging.Logger:
-    """Generate custom Logger object writes output to both file and standard output.
+class SamplingFilter(logging.Filter):
+    """Pass only a random sample of records (e.g. high volume lookup misses)."""
 
-    Creates parent directories and blank log file (if missing)
-    https://docs.python.org/3/library/logging.html#logging-levels
+    def __init__(self, rate: float = 1.0) -> None:
+        """Create filter.
+
+        Args:
+            rate (float): share of records to keep (0.0: drop all, 1.0: keep all)
+        """
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep record with probability of sampling rate."""
+        return self.rate >= 1.0 or random.random() < self.rate
 
-    Args:
-        caller (str): __file__ of calling module passed to getLogger()
+
+@lru_cache(maxsize=1)
+def start_log_listener() -> QueueListener:
+    """Process-wide background thread which writes queued records to file and console (started once).
+
+    Creates parent directories and blank log file (if missing)
+    https://docs.python.org/3/howto/logging-cookbook.html#dealing-with-handlers-that-block
 
     Returns:
-        logging.Logger: instance based on name and file location
+        QueueListener: running listener (stopped at interpreter exit)
     """
     # create log directory and empty file (if needed)
     log_file = Path(PROJECT_ROOT, "logs", f"{REPO_NAME}.log")
@@ -53,10 +70,6 @@ def init_logger(
     if not log_file.is_file():
         log_file.touch(mode=0o777, exist_ok=True)
 
-    # when passing __file__, set to caller basename
-    logger = logging.getLogger(name=Path(caller).name)
-    logger.setLevel(level=logging.INFO)
-
     # update custom log format
     log_format = logging.Formatter(
         fmt="{asctime} [{levelname}] {name} | {funcName}() line:{lineno} | {message}",
@@ -74,11 +87,36 @@ def init_logger(
     fh.setLevel(level=logging.DEBUG)
     fh.setFormatter(fmt=log_format)
     fh.namer = namer
-    logger.addHandler(hdlr=fh)
 
-    # display messages to console
-    sh = logging.StreamHandler(sys.stdout)
+    # display messages to console (stderr keeps stdout free for piped results)
+    sh = logging.StreamHandler(sys.stderr)
     sh.setLevel(level=logging.INFO)
     sh.setFormatter(fmt=log_format)
-    logger.addHandler(hdlr=sh)
+
+    listener = QueueListener(queue.SimpleQueue(), fh, sh, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def init_logger(
+    caller: str,
+) -> logging.Logger:
+    """Generate custom Logger object writes output to both file and standard error.
+
+    records are enqueued by caller (non-blocking), file/console I/O runs on shared listener thread
+    https://docs.python.org/3/library/logging.html#logging-levels
+
+    Args:
+        caller (str): __file__ of calling module passed to getLogger()
+
+    Returns:
+        logging.Logger: instance based on name and file location
+    """
+    # when passing __file__, set to caller basename
+    logger = logging.getLogger(name=Path(caller).name)
+    logger.setLevel(level=logging.INFO)
+    # attach handler only once per logger (repeated calls return same instance)
+    if not any(isinstance(handler, QueueHandler) for handler in logger.handlers):
+        logger.addHandler(hdlr=QueueHandler(start_log_listener().queue))
     return logger
@@ -0,0 +1,93 @@
+"""Bounded least recently used (LRU) cache with hit/miss statistics."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+
+class CacheStats(NamedTuple):
+    """Snapshot of cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class LruCache:
+    """Thread-safe mapping which evicts least recently used entry once maxsize is reached.
+
+    https://docs.python.org/3/library/collections.html#ordereddict-examples-and-recipes
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Create empty cache.
+
+        Args:
+            maxsize (int): maximum number of entries (0 disables caching)
+        """
+        if maxsize < 0:
+            raise ValueError(f"invalid {maxsize=} (must be >= 0)")
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Current number of entries."""
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value (marked most recently used), otherwise default."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert value, evict least recently used entries beyond maxsize."""
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        """Change maximum number of entries (evicts surplus entries)."""
+        if maxsize < 0:
+            raise ValueError(f"invalid {maxsize=} (must be >= 0)")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Current hits, misses, evictions and size."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+                maxsize=self._maxsize,
+            )
+
+    def _evict(self) -> None:
+        """Drop oldest entries (caller must hold lock)."""
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
@@ -0,0 +1,61 @@
+"""Interned string table (each distinct string stored once, referred to by integer id).
+
+vendor acronyms repeat across vendors (e.g. "TR", "TE", "TI" for every vendor), runtime models and indexes
+store integer ids, id sets allow cheap set operations (e.g. acronyms shared by vendors)
+
+ids are assigned in order of first occurrence and are only valid within current process
+"""
+
+import sys
+import threading
+from typing import Dict, Final, Iterable, List, Optional, Tuple
+
+
+class StringTable:
+    """Append-only, thread-safe mapping between strings and integer ids."""
+
+    __slots__ = ("_strings", "_ids", "_lock")
+
+    def __init__(self) -> None:
+        """Create empty table."""
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of distinct strings."""
+        return len(self._strings)
+
+    def __getitem__(self, string_id: int) -> str:
+        """String of given id."""
+        return self._strings[string_id]
+
+    def intern(self, text: str) -> int:
+        """Id of string (added to table on first occurrence)."""
+        string_id = self._ids.get(text)
+        if string_id is not None:
+            return string_id
+        with self._lock:
+            string_id = self._ids.get(text)
+            if string_id is None:
+                string_id = len(self._strings)
+                self._strings.append(sys.intern(text))
+                self._ids[self._strings[string_id]] = string_id
+            return string_id
+
+    def intern_many(self, texts: Iterable[str]) -> Tuple[int, ...]:
+        """Ids of strings (in input order)."""
+        return tuple(self.intern(text) for text in texts)
+
+    def get_id(self, text: str) -> Optional[int]:
+        """Id of string, None if string was never interned (table is unchanged)."""
+        return self._ids.get(text)
+
+    def lookup(self, string_ids: Iterable[int]) -> Tuple[str, ...]:
+        """Strings of ids (in input order)."""
+        strings = self._strings
+        return tuple(strings[string_id] for string_id in string_ids)
+
+
+# shared by runtime catalog and search indexes
+ACRONYM_TABLE: Final[StringTable] = StringTable()
@@ -0,0 +1,30 @@
+"""Shared test fixtures."""
+
+import os
+import subprocess
+import sys
+from typing import Callable
+
+import pytest
+
+
+@pytest.fixture
+def run_python() -> Callable[..., str]:
+    """Run python code in fresh interpreter (empty module and lru caches, same import path).
+
+    Returns:
+        callable: code (str), extra environment variables (keyword arguments) -> captured stdout
+    """
+
+    def run(code: str, **env: str) -> str:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), **env},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout
+
+    return run
@@ -0,0 +1,107 @@
+"""Test precomputed acronym search indexes."""
+
+import pytest
+from rapidfuzz import fuzz
+from rapidfuzz.distance import Levenshtein
+
+from mri_acronyms.index.acronym_index import AcronymIndex, MatchPath, get_acronym_index
+from mri_acronyms.index.bk_tree import get_bk_tree, within_distance
+from mri_acronyms.index.ngram_index import NGRAM_MIN_CUTOFF, NgramIndex
+from mri_acronyms.index.vendor_translation import translate, translate_many
+from mri_acronyms.lut.category_to_acronym_lut import CATEGORY_TO_ACRONYM_LUT
+from mri_acronyms.lut.vendor_acronym_lut import VENDOR_ACRONYM_LUT
+from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory
+from mri_acronyms.models.validate_models import exact_key, sanitize
+
+
+def test_acronym_index_covers_lut():
+    """Check every acronym in lookup table is indexed with its category and name."""
+    index = get_acronym_index()
+    expected = [
+        (category, name, acronym)
+        for category, models in CATEGORY_TO_ACRONYM_LUT.items()
+        for name, acronyms in models.items()
+        for acronym in acronyms
+    ]
+    assert list(zip(index.categories, index.names, index.acronyms)) == expected
+    assert all(key == acronym.lower() for key, acronym in zip(index.keys, index.acronyms))
+
+
+def test_acronym_index_best_match():
+    """Check identical keyword (mixed case) is scored as perfect match."""
+    index = get_acronym_index()
+    match = index.best_match("haste")
+    assert match is not None
+    position, confidence = match
+    assert index.names[position] == "single_shot_tse"
+    assert confidence == 100.0
+
+
+def test_acronym_index_exact_path():
+    """Check case-insensitive exact keywords skip fuzzy scoring."""
+    index = get_acronym_index()
+    for keyword in ["haste", "TSE", "tse!", "Single-shot fse"]:
+        hit = index.lookup(keyword)
+        assert hit is not None
+        position, confidence, path = hit
+        assert path == MatchPath.EXACT
+        assert confidence == 100.0
+        assert index.keys[position] == sanitize(keyword).lower()
+    hit = index.lookup("hasteee")
+    assert hit is not None and hit[2] == MatchPath.FUZZY
+
+
+def test_ngram_prefilter_recall():
+    """Check n-gram prefilter keeps every acronym scoring above cutoff (including short keywords)."""
+    index = get_acronym_index()
+    ngrams = NgramIndex.from_keys(index.keys)
+    keywords = ["se", "ti", "flairr", "haset", "single shot", "diffusion tensr", "t2 star", "qwertyuiop"]
+    for keyword in keywords + [key[:-1] for key in index.keys]:
+        for cutoff in (50.0, 70.0, 85.0, 90.0):
+            candidates = set(ngrams.candidates(keyword, cutoff))
+            expected = {i for i, key in enumerate(index.keys) if fuzz.ratio(keyword, key) >= cutoff}
+            assert expected <= candidates
+
+
+def test_ngram_prefilter_best_match():
+    """Check prefiltered index agrees with brute force search."""
+    index = get_acronym_index()
+    prefiltered = AcronymIndex.from_lut(CATEGORY_TO_ACRONYM_LUT, use_ngrams=True)
+    # n-gram index is only built by first query which can use it
+    prefiltered.best_match("hasteee", cutoff=70.0)
+    assert "ngrams" not in vars(prefiltered)
+    for keyword in ["hasteee", "flairr", "tse", "single-shot-fse", "qwertyuiop"]:
+        expected = index.best_match(keyword)
+        if expected is not None and expected[1] < NGRAM_MIN_CUTOFF:
+            expected = None
+        assert prefiltered.best_match(keyword, cutoff=NGRAM_MIN_CUTOFF) == expected
+    assert "ngrams" in vars(prefiltered)
+
+
+def test_bk_tree_within_distance():
+    """Check typos resolve to acronyms within edit distance, visiting subset of tree."""
+    assert ("FLAIR", 1) in within_distance("FLAIRR", max_edits=2)
+    assert ("HASTE", 2) in within_distance("haset", max_edits=2)
+    assert within_distance("se", max_edits=0) == [("SE", 0)]
+    tree = get_bk_tree()
+    for keyword in ["flairr", "haset", "diffusion"]:
+        matches, visited = tree.search(keyword, max_edits=2)
+        expected = {term for term in tree.terms if Levenshtein.distance(keyword, term) <= 2}
+        assert {term for term, _ in matches} == expected
+        assert visited < len(tree)
+
+
+def test_translate_vendor_acronym():
+    """Check cross-vendor translation through precomputed reverse index (case-insensitive)."""
+    assert translate("HASTE", from_vendor="siemens", to_vendor="ge") == ("Single-Shot FSE",)
+    assert translate("fase", from_vendor="canon", to_vendor="siemens") == ("HASTE",)
+    assert translate("unknown", from_vendor="siemens", to_vendor="ge") == ()
+    with pytest.raises(ValueError):
+        translate("HASTE", from_vendor="siemens", to_vendor="bruker")
+    acronyms = ["HASTE", "TSE", "missing", "TR"]
+    expected = [translate(acronym, "siemens", "philips") for acronym in acronyms]
+    assert translate_many(acronyms, from_vendor="siemens", to_vendor="philips") == expected
+    for vendor, reverse_index in VENDOR_ACRONYM_LUT.items():
+        for key, (category, name) in reverse_index.items():
+            model = PulseSequenceCategory.get_model(category, name)
+            assert key in {exact_key(word) for word in getattr(model, vendor)}
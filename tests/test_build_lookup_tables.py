@@ -1,9 +1,11 @@
 """Test dynamically generated lookup table."""
 
-from typing import Dict, List
+import sys
+from typing import Dict, List, Tuple, Union
 
 from mri_acronyms import build_lookup_table
 from mri_acronyms.lut.category_to_acronym_lut import CATEGORY_TO_ACRONYM_LUT
+from mri_acronyms.models.validate_models import get_catalog_index
 
 
 def test_build_lut_table():
@@ -13,3 +15,45 @@ def test_build_lut_table():
     assert isinstance(CATEGORY_TO_ACRONYM_LUT["SPIN_ECHO_SEQUENCES"], Dict)
     assert isinstance(CATEGORY_TO_ACRONYM_LUT["SPIN_ECHO_SEQUENCES"]["spin_echo"], List)
     assert len(CATEGORY_TO_ACRONYM_LUT["SPIN_ECHO_SEQUENCES"]["spin_echo"]) == 1
+
+
+def test_emitter_matches_black():
+    """Check streamed lookup table is deterministic and already in black formatting."""
+    docstring = "Test lookup table.\n\nauto-generated\n"
+    code_block: Dict[str, Dict[str, Union[List[str], Tuple[str, ...]]]] = {
+        "SPIN_ECHO_SEQUENCES": {"spin_echo": ["SE", 'say "hi"', "a\\b"], "empty": []},
+        "PARAMETERS": {"pair": ("TE", "TR")},
+    }
+    text = "".join(build_lookup_table.iter_py_lines(name="LUT", docstring=docstring, code_block=code_block))
+    assert text == "".join(build_lookup_table.iter_py_lines(name="LUT", docstring=docstring, code_block=code_block))
+    assert build_lookup_table.blacken_code_block(text) == text
+
+
+def test_verify_skipped_without_black(monkeypatch, tmp_path):
+    """Check black stays optional (verification is skipped with warning if black is not installed)."""
+    monkeypatch.setitem(sys.modules, "black", None)
+    monkeypatch.setattr(build_lookup_table, "lut_path", lambda name: tmp_path / f"{name.lower()}.py")
+    code_block = {"SPIN_ECHO_SEQUENCES": {"spin_echo": ["SE"]}}
+    assert build_lookup_table.save_to_py_file(name="LUT", docstring="Test.\n", code_block=code_block, verify=True)
+    assert (tmp_path / "lut.py").is_file()
+
+
+def test_build_lut_skipped_if_unchanged():
+    """Check lookup table is not rewritten if catalog content hash matches."""
+    path = build_lookup_table.lut_path(build_lookup_table.LUT_NAME)
+    assert build_lookup_table.generate(sort_keys=False)
+    assert build_lookup_table.read_content_hash(path) is not None
+    modified = path.stat().st_mtime_ns
+    assert build_lookup_table.generate(sort_keys=False)
+    assert path.stat().st_mtime_ns == modified
+
+
+def test_catalog_index():
+    """Check single pass catalog index agrees with lookup table and has no duplicates."""
+    index = get_catalog_index()
+    assert get_catalog_index() is index
+    assert len(index.entries) == sum(len(names) for names in CATEGORY_TO_ACRONYM_LUT.values())
+    for category, model, acronyms in index.entries:
+        assert sorted(set(acronyms)) == CATEGORY_TO_ACRONYM_LUT[category.name][model.name]
+        assert index.name_to_categories[model.name] == (category.name,)
+    assert index.acronym_to_locations["SE"] == ("SPIN_ECHO_SEQUENCES.spin_echo",)
@@ -0,0 +1,18 @@
+"""Test parallel batch classification."""
+
+import io
+
+from mri_acronyms.classify_batch import classify_file
+from mri_acronyms.search_by_keyword import get_random_words, get_valid_words, stream_matches
+
+
+def test_classify_file_preserves_order(tmp_path):
+    """Check sharded process pool output matches single process streaming output."""
+    path = tmp_path / "keywords.txt"
+    path.write_text("\n".join(get_valid_words() + get_random_words(sample_size=64)) + "\n", encoding="utf-8")
+    expected = io.StringIO()
+    with open(path, encoding="utf-8") as lines:
+        count = stream_matches(lines, expected)
+    output = io.StringIO()
+    assert classify_file(path, output, shard_size=37, max_workers=2) == count
+    assert output.getvalue() == expected.getvalue()
@@ -1,8 +1,41 @@
 """Test report creation."""
 
-from mri_acronyms.create_report import save_report
+import polars as pl
+
+from mri_acronyms.create_report import save_report, scan_report
+from mri_acronyms.util.constants import HEADERS, SEP
 
 
 def test_built_lut_table():
     """Check dynamically generated CSV report is updated."""
     assert save_report()
+
+
+def test_report_formats(tmp_path):
+    """Check CSV, Parquet and Arrow IPC reports contain identical tables (typed list/enum columns)."""
+    path = tmp_path / "report.csv"
+    assert save_report(path=path, formats=("csv", "parquet", "ipc"))
+    df = pl.read_csv(path, schema_overrides={column: pl.String for column in HEADERS[1:]}).fill_null("")
+    assert df.columns == HEADERS
+    assert df.height > 0
+    for typed in (pl.read_parquet(path.with_suffix(".parquet")), scan_report(path.with_suffix(".arrow")).collect()):
+        assert typed.schema[HEADERS[1]] == pl.Enum
+        assert all(typed.schema[column] == pl.List(pl.String) for column in HEADERS[3:])
+        joined = typed.with_columns(
+            pl.col(HEADERS[0]).cast(pl.Int64), pl.col(HEADERS[1]).cast(pl.String), pl.col(HEADERS[3:]).list.join(SEP)
+        )
+        assert joined.equals(df)
+
+
+def test_report_skipped_if_unchanged(tmp_path):
+    """Check report is only rewritten if catalog content changed (or forced)."""
+    path = tmp_path / "report.csv"
+    assert save_report(path=path)
+    assert (tmp_path / "report.csv.sha256").is_file()
+    modified = path.stat().st_mtime_ns
+    assert save_report(path=path)
+    assert path.stat().st_mtime_ns == modified
+    (tmp_path / "report.csv.sha256").write_text("stale")
+    assert save_report(path=path)
+    assert (tmp_path / "report.csv.sha256").read_text().strip() != "stale"
+    assert not list(tmp_path.glob(".*.tmp"))
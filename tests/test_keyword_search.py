@@ -1,10 +1,25 @@
 """Test keyword matching logic."""
 
+import io
+import json
 import random
 import string
 
-from mri_acronyms.search_by_keyword import get_random_words, get_valid_words, match_acronym
-from mri_acronyms.util.constants import VALID_SYMBOLS
+from mri_acronyms.index.acronym_index import MatchPath
+from mri_acronyms.search_by_keyword import (
+    cache_stats,
+    clear_cache,
+    configure_cache,
+    configure_miss_logging,
+    get_random_words,
+    get_valid_words,
+    lookup_acronym,
+    match_acronym,
+    match_acronyms,
+    search,
+    stream_matches,
+)
+from mri_acronyms.util.constants import LOOKUP_CACHE_SIZE, MISS_LOG_SAMPLE_RATE, VALID_SYMBOLS
 
 
 def test_check_valid_words():
@@ -49,3 +64,97 @@ def test_check_valid_substrings():
             if len(substring) > 7:
                 result = match_acronym(keyword=substring, cutoff=50.0)
                 assert result
+
+
+def test_batch_matches_single():
+    """Check batch search agrees with per keyword search."""
+    keywords = get_valid_words() + get_random_words(sample_size=16) + ["", "x", "advanced intelligent clar-iq engine"]
+    for keyword, result in zip(keywords, match_acronyms(keywords=keywords)):
+        model = match_acronym(keyword=keyword)
+        if model is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result.name == model.name
+            assert result.model is model
+            single = lookup_acronym(keyword=keyword)
+            assert single is not None
+            assert result.confidence == single.confidence
+
+
+def test_lookup_cache_stats():
+    """Check repeated keywords (case-insensitive) are answered from bounded cache."""
+    clear_cache()
+    configure_cache(maxsize=2)
+    try:
+        for keyword in ["HASTE", "haste", "TSE", "FLAIR", "haste"]:
+            assert match_acronym(keyword=keyword)
+        stats = cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 4
+        assert stats.evictions == 2
+        assert stats.size == 2
+    finally:
+        configure_cache(maxsize=LOOKUP_CACHE_SIZE)
+        clear_cache()
+
+
+def test_search_top_k():
+    """Check ranked results are unique per pulse sequence/parameter and above cutoff."""
+    results = search(keyword="FSE", k=5, cutoff=50.0)
+    assert 1 < len(results) <= 5
+    assert results[0].name == "turbo_spin_echo"
+    assert results[0].confidence == 100.0
+    assert len({(result.category, result.name) for result in results}) == len(results)
+    assert all(a.confidence >= b.confidence > 50.0 for a, b in zip(results, results[1:]))
+    assert not search(keyword="zzzzzzzzzzzz", k=5, cutoff=75.0)
+
+
+def test_stream_matches():
+    """Check streamed keywords produce one JSON line per keyword in input order."""
+    lines = io.StringIO("HASTE\n  flair \nzzzzzzzzzzzz\n\nTSE\n")
+    output = io.StringIO()
+    assert stream_matches(lines, output, cutoff=75.0, chunk_size=2) == 5
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [record["keyword"] for record in records] == ["HASTE", "flair", "zzzzzzzzzzzz", "", "TSE"]
+    assert records[0]["name"] == "single_shot_tse"
+    assert records[0]["path"] == "exact"
+    assert records[2]["name"] is None
+    assert records[4]["category"] == "SPIN_ECHO_SEQUENCES"
+
+
+def test_matcher_import_skips_english_corpus(run_python):
+    """Check importing matcher does not load dictionary corpus (only needed for random samples)."""
+    run_python("import sys; import mri_acronyms.search_by_keyword; assert 'english_words' not in sys.modules")
+
+
+def test_lookup_acronym_result(capsys):
+    """Check silent lookup returns structured result (model, acronym, confidence, path)."""
+    result = lookup_acronym(keyword="haste")
+    assert result is not None and result.model is not None
+    assert result.acronym == "HASTE"
+    assert result.confidence == 100.0
+    assert result.path == MatchPath.EXACT
+    assert result.model.name == "single_shot_tse"
+    fuzzy = lookup_acronym(keyword="hastee")
+    assert fuzzy is not None and fuzzy.path == MatchPath.FUZZY
+    assert lookup_acronym(keyword="zzzzzzzzzzzz") is None
+    assert match_acronym(keyword="haste") is result.model
+    assert capsys.readouterr().out == ""
+
+
+def test_sampled_out_misses_are_not_formatted():
+    """Check miss message is only formatted if record passes sampling filter (lazy logging arguments)."""
+    formatted = []
+
+    class Keyword(str):
+        def __str__(self):
+            formatted.append(self)
+            return super().__str__()
+
+    configure_miss_logging(sample_rate=0.0)
+    try:
+        assert match_acronym(keyword=Keyword("zzzzzzzzzzzz")) is None
+        assert not formatted
+    finally:
+        configure_miss_logging(sample_rate=MISS_LOG_SAMPLE_RATE)
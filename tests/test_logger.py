@@ -0,0 +1,22 @@
+"""Test logging setup."""
+
+import logging
+from logging.handlers import QueueHandler
+
+from mri_acronyms.util.logger import SamplingFilter, init_logger, start_log_listener
+
+
+def test_init_logger_attaches_handler_once():
+    """Check repeated calls reuse single queue handler and shared listener."""
+    logger = init_logger(caller=__file__)
+    assert init_logger(caller=__file__) is logger
+    handlers = [handler for handler in logger.handlers if isinstance(handler, QueueHandler)]
+    assert len(handlers) == 1
+    assert handlers[0].queue is start_log_listener().queue
+
+
+def test_sampling_filter():
+    """Check sampling rate drops/keeps records."""
+    record = logging.LogRecord("test", logging.ERROR, __file__, 1, "miss", None, None)
+    assert not any(SamplingFilter(rate=0.0).filter(record) for _ in range(100))
+    assert all(SamplingFilter(rate=1.0).filter(record) for _ in range(100))
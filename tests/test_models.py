@@ -0,0 +1,168 @@
+"""Test catalog models (loading, snapshot, compact runtime view, sanitizer)."""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from mri_acronyms import build_lookup_table
+from mri_acronyms.lut.category_to_acronym_lut import CATEGORY_TO_ACRONYM_LUT
+from mri_acronyms.models.catalog_loader import CATALOG_ENV, export_catalog, load_catalog, validate_catalog
+from mri_acronyms.models.catalog_snapshot import SNAPSHOT_PATH, load_snapshot
+from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory
+from mri_acronyms.models.pydantic_models import MriParameterModel, MriSequenceModel
+from mri_acronyms.models.validate_models import get_catalog_index, sanitize, sanitize_many, sanitize_regex
+from mri_acronyms.search_by_keyword import get_sample
+from mri_acronyms.util.constants import VENDORS
+from mri_acronyms.util.string_table import ACRONYM_TABLE
+
+CATEGORIES = tuple(PulseSequenceCategory.__members__)
+
+
+def test_sanitize_matches_regex():
+    """Check translate table sanitizer agrees with regex reference implementation."""
+    words = [
+        word for entry in get_catalog_index().entries for vendor in VENDORS for word in getattr(entry.model, vendor)
+    ]
+    words += ["  T2*  flair\t(fs) ", "a\u00a0\u2003b", "\x1cSE\x1f", "é-ß|/.*", "'\"#$%&", "TSE\n\nHASTE", "", "   "]
+    words += [word for word in get_sample(sample_size=200, include_random=True) if isinstance(word, str)]
+    assert sanitize_many(words) == [sanitize_regex(word) for word in words]
+    assert [sanitize(word) for word in words] == [sanitize_regex(word) for word in words]
+
+
+def test_acronyms_interned():
+    """Check acronyms repeated across vendors share one string table entry."""
+    model = PulseSequenceCategory.get_model(category="scanner_parameters", name="repetition_time")
+    tr_id = ACRONYM_TABLE.get_id("TR")
+    assert model is not None and tr_id is not None
+    assert all(tr_id in ids for ids in model.vendor_ids)
+    assert model.acronym_ids == {tr_id, ACRONYM_TABLE.get_id("Repetition Time")}
+    assert model.ge == ("TR",)
+    assert ACRONYM_TABLE.intern("TR") == tr_id
+    assert ACRONYM_TABLE.lookup(model.vendor_ids[0]) == ("Repetition Time", "TR")
+
+
+def test_catalog_file_round_trip(tmp_path):
+    """Check catalog exported to data files validates (batch) to identical models."""
+    catalog = {category.name: category.acronyms for category in PulseSequenceCategory}
+    expected = {category: [model.model_dump() for model in models] for category, models in catalog.items()}
+    for suffix in (".json", ".parquet"):
+        path = tmp_path / f"catalog{suffix}"
+        assert export_catalog(catalog, path)
+        loaded = load_catalog(path, CATEGORIES)
+        assert {category: [model.model_dump() for model in models] for category, models in loaded.items()} == expected
+    toml = tmp_path / "catalog.toml"
+    toml.write_text(
+        '[[SCANNER_PARAMETERS]]\nname = "echo_time"\ndescription = "TE"\nurl = "https://example.com"\nge = ["TE"]\n'
+    )
+    assert isinstance(load_catalog(toml, CATEGORIES)["SCANNER_PARAMETERS"][0], MriParameterModel)
+    with pytest.raises(ValueError, match="SPIN_ECHO"):
+        validate_catalog(
+            {"SPIN_ECHO": [{"name": "spin_echo", "description": "SE", "url": "https://example.com"}]}, CATEGORIES
+        )
+
+
+def test_external_catalog_source(tmp_path, run_python):
+    """Check site vocabulary from data file replaces pulse_sequences modules (without code changes)."""
+    path = tmp_path / "site_catalog.json"
+    model = PulseSequenceCategory.SPIN_ECHO_SEQUENCES.get_full_model("spin_echo")
+    assert model is not None
+    records = {"SPIN_ECHO_SEQUENCES": [model.model_dump(mode="json")]}
+    records["SPIN_ECHO_SEQUENCES"][0]["siemens"].append("SITE_SE")
+    path.write_text(json.dumps(records))
+    code = (
+        "import sys; from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory as psc; "
+        "assert 'SITE_SE' in psc.get_model('spin_echo_sequences', 'spin_echo').siemens; "
+        "assert not psc.CARDIAC_SEQUENCES.acronyms; "
+        "from mri_acronyms.search_by_keyword import lookup_acronym, match_acronym; "
+        "assert lookup_acronym('site_se').model.name == 'spin_echo'; "
+        "assert match_acronym('HASTE') is None and lookup_acronym('HASTE') is None; "
+        "from mri_acronyms.index.vendor_translation import translate; "
+        "assert translate('site_se', 'siemens', 'ge') == psc.get_model('spin_echo_sequences', 'spin_echo').ge; "
+        "from mri_acronyms.build_lookup_table import generate; assert not generate(sort_keys=False); "
+        "assert not [m for m in sys.modules if m.startswith('mri_acronyms.pulse_sequences.')]"
+    )
+    run_python(code, **{CATALOG_ENV: str(path)})
+
+
+def test_get_models():
+    """Check (case-insensitive) bulk model lookup agrees with lookup table."""
+    pairs = [
+        (category.lower(), name.upper())
+        for category in CATEGORY_TO_ACRONYM_LUT
+        for name in CATEGORY_TO_ACRONYM_LUT[category]
+    ]
+    models = PulseSequenceCategory.get_models(pairs + [("spin_echo_sequences", "missing")])
+    assert [model.name if model else None for model in models[:-1]] == [name.lower() for _, name in pairs]
+    assert models[-1] is None
+    assert PulseSequenceCategory.get_model(category="SPIN_ECHO_SEQUENCES", name="spin_echo") is models[0]
+
+
+def test_categories_load_lazily(run_python):
+    """Check category models are only loaded (module imported or snapshot restored) on first access."""
+    code = (
+        "import sys; from mri_acronyms.models.pulse_sequence_category import get_compact_models, load_acronyms; "
+        "from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory as psc; "
+        "loaded = lambda: {m for m in sys.modules if m.startswith('mri_acronyms.pulse_sequences.')}; "
+        "assert not loaded(); model = psc.get_model('spin_echo_sequences', 'spin_echo'); "
+        "assert loaded() <= {'mri_acronyms.pulse_sequences.spin_echo'}, loaded(); "
+        "assert get_compact_models.cache_info().currsize == 1; "
+        "assert load_acronyms.cache_info().currsize <= 1; "
+        "assert model.to_model().name == model.name; "
+        "assert load_acronyms.cache_info().currsize == 1"
+    )
+    run_python(code)
+
+
+def test_compact_model():
+    """Check compact runtime model mirrors validated pydantic model and is read-only."""
+    model = PulseSequenceCategory.get_model(category="spin_echo_sequences", name="TURBO_SPIN_ECHO")
+    assert model is not None
+    full = model.to_model()
+    assert isinstance(full, MriSequenceModel)
+    assert model.category is PulseSequenceCategory.SPIN_ECHO_SEQUENCES
+    assert all(getattr(model, vendor) == tuple(getattr(full, vendor)) for vendor in VENDORS)
+    assert not hasattr(model, "__dict__")
+    with pytest.raises(AttributeError):
+        model.name = "other"
+
+
+def test_compact_model_copy_and_pickle():
+    """Check compact models can be copied and sent between processes (rebuilt from strings, not table ids)."""
+    model = PulseSequenceCategory.get_model(category="spin_echo_sequences", name="single_shot_tse")
+    assert model is not None
+    for clone in (copy.copy(model), copy.deepcopy(model), pickle.loads(pickle.dumps(model))):
+        assert repr(clone) == repr(model)
+        assert clone.category is model.category
+    assert b"vendor_ids" not in pickle.dumps(model)
+
+
+def test_catalog_snapshot(run_python):
+    """Check snapshot restores identical models without importing (validating) pulse sequence modules."""
+    build_lookup_table.generate(sort_keys=False)
+    code = (
+        "import sys; from mri_acronyms.models.pulse_sequence_category import PulseSequenceCategory as psc; "
+        "models = {c.name: [m.model_dump() for m in c.acronyms] for c in psc}; "
+        "assert not any(m.startswith('mri_acronyms.pulse_sequences.') for m in sys.modules); "
+        "print(repr(models))"
+    )
+    restored = run_python(code)
+    expected = {
+        category.name: [model.model_dump() for model in category.acronyms] for category in PulseSequenceCategory
+    }
+    assert restored.strip() == repr(expected)
+    assert load_snapshot("SPIN_ECHO_SEQUENCES", path=SNAPSHOT_PATH.with_name("missing.pickle")) is None
+
+
+def test_stale_snapshot_body_is_not_unpickled(tmp_path):
+    """Check snapshot header is validated before body (stale or corrupt snapshot falls back to None)."""
+    stale = tmp_path / "stale.pickle"
+    with stale.open("wb") as file:
+        pickle.dump({"version": -1, "digest": ""}, file)
+        # body would raise on unpickling (import of missing module)
+        file.write(b"cmissing_module\nmissing\n.")
+    assert load_snapshot("SPIN_ECHO_SEQUENCES", path=stale) is None
+    corrupt = tmp_path / "corrupt.pickle"
+    corrupt.write_bytes(b"not a pickle")
+    assert load_snapshot("SPIN_ECHO_SEQUENCES", path=corrupt) is None